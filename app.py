@@ -10,10 +10,16 @@ import webbrowser
 import threading
 import time
 from flask import Flask, render_template, request, jsonify, send_from_directory, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
 import sqlite3
 from datetime import datetime
 import json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add project modules to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'resume_scanner'))
@@ -23,16 +29,41 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'portfolio_analyzer'))
 
 # Import our custom modules
 try:
-    from resume_scanner.resume_analyzer import ResumeAnalyzer
-    from code_analyzers.code_quality_checker import CodeQualityChecker
-    from job_matcher.job_recommender import JobRecommender
-    from portfolio_analyzer.portfolio_checker import PortfolioAnalyzer
+    from resume_scanner import get_resume_analyzer
+    from code_analyzers import get_quality_checker
+    from job_matcher import get_recommender
+    from portfolio_analyzer import get_portfolio_analyzer
 except ImportError as e:
     print(f"Warning: Some modules not yet available: {e}")
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes responses with orjson when it is installed"""
+    
+    def dumps(self, obj, **kwargs):
+        # Pretty-printed debug output and orjson-unsupported values (e.g. huge ints) use the stdlib path
+        if ORJSON_AVAILABLE and kwargs.get('indent') is None:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            if kwargs.get('sort_keys', self.sort_keys):
+                option |= orjson.OPT_SORT_KEYS
+            try:
+                return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode('utf-8')
+            except TypeError:
+                pass
+        return super().dumps(obj, **kwargs)
+
+def dump_json(obj):
+    """Serialize analysis results for storage, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(obj)
+
 app = Flask(__name__, 
            template_folder='frontend/templates',
            static_folder='frontend/static')
+app.json = OrjsonProvider(app)
 
 app.config['SECRET_KEY'] = 'devmatch-ai-secret-key-2024'
 app.config['UPLOAD_FOLDER'] = 'uploads'
@@ -54,9 +85,18 @@ def allowed_file(filename, file_type):
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS.get(file_type, set())
 
+def connect_database():
+    """Open devmatch.db with the per-connection settings that suit its WAL journal."""
+    conn = sqlite3.connect('devmatch.db')
+    # synchronous is not stored in the file; NORMAL is safe under WAL and skips the fsync on each commit
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
 def init_database():
     """Initialize SQLite database for storing analysis results."""
-    conn = sqlite3.connect('devmatch.db')
+    conn = connect_database()
+    # WAL is stored in the database file, so every later connection inherits it
+    conn.execute('PRAGMA journal_mode=WAL')
     cursor = conn.cursor()
     
     # Create tables
@@ -136,7 +176,7 @@ def upload_file():
 def analyze_resume(filepath):
     """Analyze uploaded resume."""
     try:
-        analyzer = ResumeAnalyzer()
+        analyzer = get_resume_analyzer()
         results = analyzer.analyze_file(filepath)
         return results
     except:
@@ -157,7 +197,7 @@ def analyze_resume(filepath):
 def analyze_code(filepath):
     """Analyze uploaded code file."""
     try:
-        checker = CodeQualityChecker()
+        checker = get_quality_checker()
         results = checker.analyze_file(filepath)
         return results
     except:
@@ -183,7 +223,7 @@ def analyze_code(filepath):
 def analyze_portfolio(filepath):
     """Analyze uploaded portfolio."""
     try:
-        analyzer = PortfolioAnalyzer()
+        analyzer = get_portfolio_analyzer()
         results = analyzer.analyze_portfolio(filepath)
         return results
     except:
@@ -204,13 +244,13 @@ def analyze_portfolio(filepath):
 
 def store_analysis_result(session_id, analysis_type, filename, results):
     """Store analysis results in database."""
-    conn = sqlite3.connect('devmatch.db')
+    conn = connect_database()
     cursor = conn.cursor()
     
     cursor.execute('''
         INSERT INTO analyses (session_id, analysis_type, filename, results)
         VALUES (?, ?, ?, ?)
-    ''', (session_id, analysis_type, filename, json.dumps(results)))
+    ''', (session_id, analysis_type, filename, dump_json(results)))
     
     conn.commit()
     conn.close()
@@ -280,7 +320,7 @@ def export_report(session_id):
 @app.route('/api/stats')
 def get_stats():
     """Get application statistics."""
-    conn = sqlite3.connect('devmatch.db')
+    conn = connect_database()
     cursor = conn.cursor()
     
     cursor.execute('SELECT COUNT(*) FROM analyses')
@@ -3,6 +3,15 @@ DevMatch AI - Code Analyzers Module
 Multi-language code analysis with custom analyzers for each language
 """
 
+from functools import lru_cache
+
 from .code_quality_checker import CodeQualityChecker
 
-__all__ = ['CodeQualityChecker']
\ No newline at end of file
+
+@lru_cache(maxsize=1)
+def get_quality_checker():
+    """Return the shared code quality checker instance, built on first use"""
+    return CodeQualityChecker()
+
+
+__all__ = ['CodeQualityChecker', 'get_quality_checker']
@@ -10,6 +10,7 @@ import json
 import subprocess
 from datetime import datetime
 from collections import defaultdict, Counter
+from common.cache import cached_by_hash
 
 class CodeQualityChecker:
     def __init__(self):
@@ -32,6 +33,24 @@ class CodeQualityChecker:
             'html': self.analyze_html,
             'css': self.analyze_css
         }
+        
+        # Extension -> display name; also resolves language names passed to analyze_source
+        self.language_names = {
+            'py': 'Python',
+            'cpp': 'C++',
+            'c': 'C',
+            'h': 'C/C++',
+            'hpp': 'C++',
+            'java': 'Java',
+            'go': 'Go',
+            'js': 'JavaScript',
+            'ts': 'TypeScript',
+            'html': 'HTML',
+            'css': 'CSS'
+        }
+        self.language_extensions = {}
+        for ext, name in self.language_names.items():
+            self.language_extensions.setdefault(name.lower(), ext)
     
     def setup_language_specific_analyzers(self):
         """Setup advanced language-specific analyzers"""
@@ -98,7 +117,7 @@ class CodeQualityChecker:
     def analyze_file(self, filepath):
         """Main analysis function for any code file"""
         try:
-            file_ext = os.path.splitext(filepath)[1][1:].lower()
+            file_ext = self.detect_language_from_ext(filepath)
             
             if file_ext not in self.analyzers:
                 return self.get_error_result(f"Unsupported file type: {file_ext}")
@@ -107,19 +126,55 @@ class CodeQualityChecker:
             with open(filepath, 'r', encoding='utf-8') as file:
                 content = file.read()
             
+            return self.analyze_source(content, file_ext, filepath)
+            
+        except Exception as e:
+            return self.get_error_result(f"Analysis failed: {str(e)}")
+    
+    def analyze_source(self, code, language, filepath=None):
+        """Analyze in-memory source code given a file extension or language name"""
+        try:
+            file_ext = self.resolve_language(language)
+            
+            if file_ext is None:
+                return self.get_error_result(f"Unsupported language: {language}")
+            
+            results = self.run_source_analysis(code, file_ext)
+            if results.get('error'):
+                return results
+            
+            # Per-call details are filled in after the (possibly cached) analysis, which only sees a placeholder path
+            if filepath is not None:
+                results['filename'] = os.path.basename(filepath)
+                if 'file_path' in results:
+                    results['file_path'] = filepath
+            results['analysis_date'] = datetime.now().isoformat()
+            
+            return results
+            
+        except Exception as e:
+            return self.get_error_result(f"Analysis failed: {str(e)}")
+    
+    @cached_by_hash('code')
+    def run_source_analysis(self, code, file_ext):
+        """Run the full (uncached) analysis of source code for a supported file extension"""
+        try:
+            # Analyzers that branch on the file name (e.g. .ts) get a matching placeholder
+            filepath = f"source.{file_ext}"
+            
             # Basic metrics
-            basic_metrics = self.calculate_basic_metrics(content)
+            basic_metrics = self.calculate_basic_metrics(code)
             
             # Language-specific analysis
             analyzer = self.analyzers[file_ext]
-            specific_analysis = analyzer(content, filepath)
+            specific_analysis = analyzer(code, filepath)
             
             # Combine results
             results = {
-                'filename': os.path.basename(filepath),
+                'filename': filepath,
                 'language': self.get_language_name(file_ext),
-                'file_size': len(content),
-                'analysis_date': datetime.now().isoformat(),
+                'file_size': len(code),
+                'analysis_date': None,
                 **basic_metrics,
                 **specific_analysis
             }
@@ -132,31 +187,31 @@ class CodeQualityChecker:
         except Exception as e:
             return self.get_error_result(f"Analysis failed: {str(e)}")
     
+    def detect_language_from_ext(self, filepath):
+        """Get the lowercase file extension used to pick an analyzer"""
+        return os.path.splitext(filepath)[1][1:].lower()
+    
+    def resolve_language(self, language):
+        """Map a file extension or language name to a supported extension"""
+        key = language.lower().lstrip('.')
+        if key in self.analyzers:
+            return key
+        return self.language_extensions.get(key)
+    
     def get_language_name(self, ext):
         """Get full language name from extension"""
-        language_map = {
-            'py': 'Python',
-            'cpp': 'C++',
-            'c': 'C',
-            'h': 'C/C++',
-            'hpp': 'C++',
-            'java': 'Java',
-            'go': 'Go',
-            'js': 'JavaScript',
-            'ts': 'TypeScript',
-            'html': 'HTML',
-            'css': 'CSS'
-        }
-        return language_map.get(ext, ext.upper())
+        return self.language_names.get(ext, ext.upper())
     
     def calculate_basic_metrics(self, content):
         """Calculate basic code metrics"""
         lines = content.split('\n')
+        # Strip each line once and share the result between the counts below
+        stripped_lines = [line.strip() for line in lines]
         
         # Line counts
         total_lines = len(lines)
-        blank_lines = sum(1 for line in lines if not line.strip())
-        comment_lines = self.count_comment_lines(lines)
+        blank_lines = stripped_lines.count('')
+        comment_lines = self.count_comment_lines(stripped_lines)
         code_lines = total_lines - blank_lines - comment_lines
         
         # Character and word counts
@@ -164,8 +219,8 @@ class CodeQualityChecker:
         total_words = len(content.split())
         
         # Average line length
-        non_empty_lines = [line for line in lines if line.strip()]
-        avg_line_length = sum(len(line) for line in non_empty_lines) / len(non_empty_lines) if non_empty_lines else 0
+        non_empty_lengths = [len(line) for line, stripped in zip(lines, stripped_lines) if stripped]
+        avg_line_length = sum(non_empty_lengths) / len(non_empty_lengths) if non_empty_lengths else 0
         
         return {
             'total_lines': total_lines,
@@ -363,7 +418,7 @@ class CodeQualityChecker:
         # Use advanced Java analyzer if available
         if self.java_analyzer:
             try:
-                return self.java_analyzer.analyze_java_code(content, filepath)
+                return self.java_analyzer.analyze_java_code(content, filepath).to_dict()
             except Exception as e:
                 print(f"Advanced Java analysis failed: {e}, falling back to basic analysis")
         
@@ -647,7 +702,8 @@ class CodeQualityChecker:
         }
         
         keywords = complexity_keywords.get(language, ['if', 'for', 'while'])
-        complexity = sum(content.lower().count(keyword) for keyword in keywords)
+        content_lower = content.lower()
+        complexity = sum(content_lower.count(keyword) for keyword in keywords)
         
         if complexity <= 5:
             return 'Low'
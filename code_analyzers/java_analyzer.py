@@ -5,7 +5,152 @@ Advanced Java code analysis focusing on OOP principles, best practices, and perf
 
 import re
 import os
-from collections import defaultdict
+from collections import defaultdict, Counter
+from collections.abc import Mapping
+
+def _count_matches(pattern, content):
+    """Count regex matches without building the findall result list"""
+    count = 0
+    for _ in pattern.finditer(content):
+        count += 1
+    return count
+
+# Comments and string/char literals, matched whole
+_NOISE_TOKENS = re.compile(r'//[^\n]*|/\*.*?(?:\*/|\Z)|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'', re.DOTALL | re.ASCII)
+_NON_NEWLINE = re.compile(r'[^\n]')
+
+def _blank_noise(match):
+    """Blank a comment, or a literal's contents (keeping its quotes), preserving newlines"""
+    text = match.group()
+    if text[0] in '"\'':
+        return text[0] + ' ' * (len(text) - 2) + text[-1]
+    return _NON_NEWLINE.sub(' ', text)
+
+def _strip_java_noise(content):
+    """Return a code-only view of content with comments and literal contents blanked
+    
+    Offsets and line breaks are preserved, so line-oriented patterns still apply.
+    """
+    return _NOISE_TOKENS.sub(_blank_noise, content)
+
+# Tokens for the brace-balancing try/catch scan: comments and string/char
+# literals are consumed whole so braces inside them are ignored
+_BLOCK_TOKENS = re.compile(_NOISE_TOKENS.pattern + r'|[{}]', re.DOTALL | re.ASCII)
+_TRY_OPEN = re.compile(r'try\s*{', re.ASCII)
+_CATCH_CLAUSE = re.compile(r'\s*catch\s*\([^)]+\)\s*{', re.ASCII)
+
+def _count_try_catch(content):
+    """Count try blocks whose matching closing brace is followed by a catch clause"""
+    try_braces = {match.end() - 1 for match in _TRY_OPEN.finditer(content)}
+    open_blocks = []  # one entry per open brace: True if it opened a try block
+    count = 0
+    
+    for token in _BLOCK_TOKENS.finditer(content):
+        text = token.group()
+        if text == '{':
+            open_blocks.append(token.start() in try_braces)
+        elif text == '}' and open_blocks:
+            if open_blocks.pop() and _CATCH_CLAUSE.match(content, token.end()):
+                count += 1
+    
+    return count
+
+class IssueList:
+    """Performance issues stored as parallel per-field lists"""
+    __slots__ = ('severity', 'description', 'count', 'pattern')
+    
+    def __init__(self):
+        self.severity = []
+        self.description = []
+        self.count = []
+        self.pattern = []
+    
+    def __len__(self):
+        return len(self.severity)
+    
+    def append(self, severity, description, count, pattern):
+        """Record a single issue"""
+        self.severity.append(severity)
+        self.description.append(description)
+        self.count.append(count)
+        self.pattern.append(pattern)
+    
+    def as_dicts(self):
+        """Return the issues as a list of dicts (the serialized result format)"""
+        return [
+            {'severity': severity, 'description': description, 'count': count, 'pattern': pattern}
+            for severity, description, count, pattern in zip(self.severity, self.description, self.count, self.pattern)
+        ]
+
+class LazyAnalysis(Mapping):
+    """Java analysis result whose sections are computed on first access"""
+    
+    def __init__(self, analyzer, content, filepath):
+        self._analyzer = analyzer
+        self._content = content
+        self._code = None
+        self._keyword_counts = None
+        self._results = {
+            'language': 'Java',
+            'file_path': filepath,
+            'lines_of_code': len(content.split('\n'))
+        }
+        self._sections = {
+            'class_analysis': lambda: analyzer.analyze_classes(self.code()),
+            'oop_analysis': lambda: analyzer.analyze_oop_principles(self.code(), self.keyword_counts()),
+            'method_analysis': lambda: analyzer.analyze_methods(self.code(), self.keyword_counts()),
+            'exception_handling': lambda: analyzer.analyze_exception_handling(self.code()),
+            'performance_analysis': lambda: analyzer.analyze_performance(self.code()),
+            'best_practices_score': lambda: analyzer.calculate_best_practices_score(self.code()),
+            'issues_found': lambda: analyzer.find_issues(self.code()),
+            'suggestions': lambda: analyzer.generate_suggestions(self.code(), self.keyword_counts()),
+            'complexity_score': lambda: analyzer.calculate_complexity(self.code()),
+            # Maintainability looks at comments, so it reads the original source
+            'maintainability_score': lambda: analyzer.calculate_maintainability(content),
+            # Only pulls in the five sections the overall score is built from
+            'quality_score': lambda: analyzer.calculate_overall_score(self)
+        }
+        self._keys = list(self._results) + list(self._sections)
+    
+    def code(self):
+        """Code-only view of the source that the pattern checks run against"""
+        if self._code is None:
+            self._code = _strip_java_noise(self._content)
+        return self._code
+    
+    def keyword_counts(self):
+        """Keyword tallies shared by the OOP, method and suggestion sections"""
+        if self._keyword_counts is None:
+            self._keyword_counts = self._analyzer.scan_keywords(self.code())
+        return self._keyword_counts
+    
+    def __getitem__(self, key):
+        if key not in self._results:
+            if key not in self._sections:
+                raise KeyError(key)
+            self._results[key] = self._sections[key]()
+        return self._results[key]
+    
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+    
+    def __contains__(self, key):
+        return key in self._results or key in self._sections
+    
+    def __iter__(self):
+        return iter(self._keys)
+    
+    def __len__(self):
+        return len(self._keys)
+    
+    def to_dict(self):
+        """Compute every section and return the full result as a plain dict"""
+        return {key: self[key] for key in self._keys}
 
 class JavaAnalyzer:
     def __init__(self):
@@ -16,7 +161,7 @@ class JavaAnalyzer:
     
     def setup_java_patterns(self):
         """Setup Java-specific patterns for analysis"""
-        self.java_patterns = {
+        java_patterns = {
             'class_structure': {
                 'class_declaration': r'(?:public\s+|private\s+|protected\s+)?class\s+(\w+)',
                 'interface_declaration': r'(?:public\s+)?interface\s+(\w+)',
@@ -58,10 +203,25 @@ class JavaAnalyzer:
                 'stream_api': r'\.stream\(\)\.(?:map|filter|collect|reduce)'
             }
         }
+        
+        # Compiled once; no re.ASCII, since Java identifiers may contain any Unicode letter
+        self.java_patterns = {
+            category: {name: re.compile(pattern) for name, pattern in patterns.items()}
+            for category, patterns in java_patterns.items()
+        }
+        
+        self.complexity_patterns = [
+            re.compile(keyword) for keyword in (
+                r'\bif\b', r'\belse\b', r'\bwhile\b', r'\bfor\b',
+                r'\bswitch\b', r'\bcase\b', r'\bcatch\b', r'\b\?\s*.*?:',
+                r'\b&&\b', r'\b\|\|\b'
+            )
+        ]
+        self.method_signature_pattern = re.compile(r'(?:public|private|protected)\s+(?:static\s+)?\w+\s+\w+\s*\(')
     
     def setup_oop_patterns(self):
         """Setup OOP principle analysis patterns"""
-        self.oop_principles = {
+        oop_principles = {
             'encapsulation': {
                 'private_fields': r'private\s+\w+\s+\w+',
                 'public_getters': r'public\s+\w+\s+get\w+\s*\(\s*\)',
@@ -87,6 +247,21 @@ class JavaAnalyzer:
                 'interface_methods': r'(?:default\s+|static\s+)?\w+\s+\w+\s*\([^)]*\)\s*(?:{|;)'
             }
         }
+        
+        self.oop_principles = {
+            principle: {name: re.compile(pattern) for name, pattern in patterns.items()}
+            for principle, patterns in oop_principles.items()
+        }
+        
+        # Literal-anchored keywords counted in a single pass; every alternative
+        # starts with a distinct keyword, so the matches never overlap
+        self.keyword_scanner = re.compile(
+            r'(?P<method_overriding>@Override(?P<override_annotation>\s*\n\s*(?:public|private|protected))?)'
+            r'|(?P<class_extension>class\s+\w+\s+extends\s+\w+)'
+            r'|(?P<interface_implementation>implements\s+\w+)'
+            r'|(?P<instanceof_usage>instanceof\s+\w+)'
+            r'|(?P<super_calls>super\s*\.)'
+        )
     
     def setup_best_practices(self):
         """Setup Java best practices checklist"""
@@ -127,10 +302,32 @@ class JavaAnalyzer:
                 'Avoid catching generic Exception'
             ]
         }
+        
+        # Presence checks shared by the scoring, issue and suggestion passes
+        self.practice_patterns = {
+            'class_naming': re.compile(r'class\s+[A-Z][a-zA-Z0-9]*'),
+            'variable_naming': re.compile(r'[a-z][a-zA-Z0-9]*\s+[A-Z][a-zA-Z0-9]*\s*[=;]'),
+            'generic_catch': re.compile(r'catch\s*\(\s*Exception\s+\w+\s*\)'),
+            'file_streams': re.compile(r'new\s+File(?:Input|Output)Stream', re.ASCII),
+            'try_with_resources': re.compile(r'try\s*\([^)]+\)', re.ASCII),
+            'public_mutable_fields': re.compile(r'public\s+(?!static\s+final)\w+\s+\w+\s*[=;]'),
+            'public_fields': re.compile(r'public\s+\w+\s+\w+\s*[=;]'),
+            'public_constants': re.compile(r'public\s+static\s+final', re.ASCII),
+            'string_concatenation': re.compile(r'\+\s*=.*?"[^"]*"', re.ASCII),
+            'private_fields': re.compile(r'private\s+\w+\s+\w+'),
+            'class_extension': re.compile(r'extends\s+\w+'),
+            'vector_usage': re.compile(r'Vector<', re.ASCII),
+            'string_creation': re.compile(r'new\s+String\s*\(', re.ASCII),
+            'enhanced_for_loop': re.compile(r'for\s*\(\s*\w+\s+\w+\s*:\s*\w+\s*\)'),
+            'indexed_for_loop': re.compile(r'for\s*\(\s*int\s+\w+\s*='),
+            'package_declaration': re.compile(r'package\s+[\w.]+\s*;'),
+            'import_statement': re.compile(r'import\s+[\w.]+\s*;'),
+            'qualified_names': re.compile(r'java\.', re.ASCII)
+        }
     
     def setup_performance_patterns(self):
         """Setup performance analysis patterns"""
-        self.performance_issues = {
+        performance_issues = {
             'critical': [
                 (r'while\s*\(\s*true\s*\)(?!.*break)', 'Infinite loop without break'),
                 (r'System\.gc\s*\(\s*\)', 'Explicit garbage collection call'),
@@ -150,29 +347,40 @@ class JavaAnalyzer:
                 (r'if\s*\([^)]*!=\s*null\s*&&[^)]*\.equals\(', 'Potential NullPointerException in equals')
             ]
         }
+        
+        # Compile once; issue patterns are matched case-insensitively
+        self.performance_issues = {
+            severity: [(re.compile(pattern, re.IGNORECASE), description) for pattern, description in patterns]
+            for severity, patterns in performance_issues.items()
+        }
+        
+        self.performance_optimizations = [
+            (re.compile(r'StringBuilder', re.ASCII), 'StringBuilder usage for string concatenation'),
+            (re.compile(r'ArrayList<', re.ASCII), 'ArrayList usage (preferred over Vector)'),
+            (re.compile(r'HashMap<', re.ASCII), 'HashMap usage (preferred over Hashtable)'),
+            (re.compile(r'for\s*\(\s*\w+\s+\w+\s*:\s*\w+\s*\)'), 'Enhanced for loops'),
+            (re.compile(r'try\s*\([^)]+\)\s*{', re.ASCII), 'Try-with-resources usage'),
+            (re.compile(r'\.isEmpty\(\)', re.ASCII), 'isEmpty() usage instead of size() == 0')
+        ]
     
     def analyze_java_code(self, content, filepath):
-        """Main Java code analysis function"""
-        analysis_results = {
-            'language': 'Java',
-            'file_path': filepath,
-            'lines_of_code': len(content.split('\n')),
-            'class_analysis': self.analyze_classes(content),
-            'oop_analysis': self.analyze_oop_principles(content),
-            'method_analysis': self.analyze_methods(content),
-            'exception_handling': self.analyze_exception_handling(content),
-            'performance_analysis': self.analyze_performance(content),
-            'best_practices_score': self.calculate_best_practices_score(content),
-            'issues_found': self.find_issues(content),
-            'suggestions': self.generate_suggestions(content),
-            'complexity_score': self.calculate_complexity(content),
-            'maintainability_score': self.calculate_maintainability(content)
-        }
+        """Main Java code analysis function
+        
+        Returns a LazyAnalysis mapping: each section (and quality_score) is
+        computed the first time it is read. Use to_dict() for the full result.
+        """
+        return LazyAnalysis(self, content, filepath)
+    
+    def scan_keywords(self, content):
+        """Count literal Java keywords (@Override, extends, implements, ...) in one pass"""
+        keyword_counts = Counter()
         
-        # Calculate overall quality score
-        analysis_results['quality_score'] = self.calculate_overall_score(analysis_results)
+        for match in self.keyword_scanner.finditer(content):
+            keyword_counts[match.lastgroup] += 1
+            if match.group('override_annotation'):
+                keyword_counts['override_annotation'] += 1
         
-        return analysis_results
+        return keyword_counts
     
     def analyze_classes(self, content):
         """Analyze class structure and design"""
@@ -186,19 +394,19 @@ class JavaAnalyzer:
         }
         
         # Find classes
-        classes = re.findall(self.java_patterns['class_structure']['class_declaration'], content)
+        classes = self.java_patterns['class_structure']['class_declaration'].findall(content)
         class_analysis['classes_found'] = classes
         
         # Find interfaces
-        interfaces = re.findall(self.java_patterns['class_structure']['interface_declaration'], content)
+        interfaces = self.java_patterns['class_structure']['interface_declaration'].findall(content)
         class_analysis['interfaces_found'] = interfaces
         
         # Find abstract classes
-        abstract_classes = re.findall(self.java_patterns['class_structure']['abstract_class'], content)
+        abstract_classes = self.java_patterns['class_structure']['abstract_class'].findall(content)
         class_analysis['abstract_classes'] = abstract_classes
         
         # Find enums
-        enums = re.findall(self.java_patterns['class_structure']['enum_declaration'], content)
+        enums = self.java_patterns['class_structure']['enum_declaration'].findall(content)
         class_analysis['enums_found'] = enums
         
         # Calculate class design score
@@ -212,8 +420,11 @@ class JavaAnalyzer:
         
         return class_analysis
     
-    def analyze_oop_principles(self, content):
+    def analyze_oop_principles(self, content, keyword_counts=None):
         """Analyze adherence to OOP principles"""
+        if keyword_counts is None:
+            keyword_counts = self.scan_keywords(content)
+        
         oop_analysis = {
             'encapsulation_score': 0,
             'inheritance_usage': 0,
@@ -223,31 +434,27 @@ class JavaAnalyzer:
         }
         
         # Analyze encapsulation
-        private_fields = len(re.findall(self.oop_principles['encapsulation']['private_fields'], content))
-        public_getters = len(re.findall(self.oop_principles['encapsulation']['public_getters'], content))
-        public_setters = len(re.findall(self.oop_principles['encapsulation']['public_setters'], content))
+        private_fields = _count_matches(self.oop_principles['encapsulation']['private_fields'], content)
+        public_getters = _count_matches(self.oop_principles['encapsulation']['public_getters'], content)
+        public_setters = _count_matches(self.oop_principles['encapsulation']['public_setters'], content)
         
         if private_fields > 0:
             oop_analysis['encapsulation_score'] = min(100, (public_getters + public_setters) / private_fields * 50 + 50)
         
         # Analyze inheritance
-        inheritance_patterns = [
-            self.oop_principles['inheritance']['class_extension'],
-            self.oop_principles['inheritance']['method_overriding'],
-            self.oop_principles['inheritance']['super_calls']
-        ]
-        
-        inheritance_count = sum(len(re.findall(pattern, content)) for pattern in inheritance_patterns)
+        inheritance_count = (
+            keyword_counts['class_extension'] +
+            keyword_counts['method_overriding'] +
+            keyword_counts['super_calls']
+        )
         oop_analysis['inheritance_usage'] = min(100, inheritance_count * 25)
         
         # Analyze polymorphism
-        polymorphism_patterns = [
-            self.oop_principles['polymorphism']['interface_implementation'],
-            self.oop_principles['polymorphism']['method_overloading'],
-            self.oop_principles['polymorphism']['instanceof_usage']
-        ]
-        
-        polymorphism_count = sum(len(re.findall(pattern, content)) for pattern in polymorphism_patterns)
+        polymorphism_count = (
+            keyword_counts['interface_implementation'] +
+            _count_matches(self.oop_principles['polymorphism']['method_overloading'], content) +
+            keyword_counts['instanceof_usage']
+        )
         oop_analysis['polymorphism_usage'] = min(100, polymorphism_count * 30)
         
         # Analyze abstraction
@@ -257,7 +464,7 @@ class JavaAnalyzer:
             self.oop_principles['abstraction']['abstract_methods']
         ]
         
-        abstraction_count = sum(len(re.findall(pattern, content)) for pattern in abstraction_patterns)
+        abstraction_count = sum(_count_matches(pattern, content) for pattern in abstraction_patterns)
         oop_analysis['abstraction_usage'] = min(100, abstraction_count * 35)
         
         # Calculate overall OOP score
@@ -270,8 +477,11 @@ class JavaAnalyzer:
         
         return oop_analysis
     
-    def analyze_methods(self, content):
+    def analyze_methods(self, content, keyword_counts=None):
         """Analyze method structure and design"""
+        if keyword_counts is None:
+            keyword_counts = self.scan_keywords(content)
+        
         method_analysis = {
             'total_methods': 0,
             'constructors': 0,
@@ -282,14 +492,14 @@ class JavaAnalyzer:
         }
         
         # Count different types of methods
-        method_analysis['total_methods'] = len(re.findall(self.java_patterns['methods']['method_declaration'], content))
-        method_analysis['constructors'] = len(re.findall(self.java_patterns['methods']['constructor'], content))
+        method_analysis['total_methods'] = _count_matches(self.java_patterns['methods']['method_declaration'], content)
+        method_analysis['constructors'] = _count_matches(self.java_patterns['methods']['constructor'], content)
         method_analysis['getters_setters'] = (
-            len(re.findall(self.java_patterns['methods']['getter_method'], content)) +
-            len(re.findall(self.java_patterns['methods']['setter_method'], content))
+            _count_matches(self.java_patterns['methods']['getter_method'], content) +
+            _count_matches(self.java_patterns['methods']['setter_method'], content)
         )
-        method_analysis['static_methods'] = len(re.findall(self.java_patterns['methods']['static_methods'], content))
-        method_analysis['overridden_methods'] = len(re.findall(self.java_patterns['methods']['override_annotation'], content))
+        method_analysis['static_methods'] = _count_matches(self.java_patterns['methods']['static_methods'], content)
+        method_analysis['overridden_methods'] = keyword_counts['override_annotation']
         
         # Calculate method design score
         if method_analysis['total_methods'] > 0:
@@ -310,10 +520,10 @@ class JavaAnalyzer:
             'exception_handling_score': 0
         }
         
-        exception_analysis['try_catch_blocks'] = len(re.findall(self.java_patterns['exception_handling']['try_catch'], content, re.DOTALL))
-        exception_analysis['finally_blocks'] = len(re.findall(self.java_patterns['exception_handling']['finally_block'], content))
-        exception_analysis['throws_declarations'] = len(re.findall(self.java_patterns['exception_handling']['throws_declaration'], content))
-        exception_analysis['custom_exceptions'] = len(re.findall(self.java_patterns['exception_handling']['custom_exceptions'], content))
+        exception_analysis['try_catch_blocks'] = _count_try_catch(content)
+        exception_analysis['finally_blocks'] = _count_matches(self.java_patterns['exception_handling']['finally_block'], content)
+        exception_analysis['throws_declarations'] = _count_matches(self.java_patterns['exception_handling']['throws_declaration'], content)
+        exception_analysis['custom_exceptions'] = _count_matches(self.java_patterns['exception_handling']['custom_exceptions'], content)
         
         # Calculate exception handling score
         total_exception_features = (exception_analysis['try_catch_blocks'] + 
@@ -334,37 +544,24 @@ class JavaAnalyzer:
         }
         
         # Check for performance issues
+        issues = IssueList()
         for severity, patterns in self.performance_issues.items():
             for pattern, description in patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                if matches:
-                    performance_analysis['issues'].append({
-                        'severity': severity,
-                        'description': description,
-                        'count': len(matches),
-                        'pattern': pattern
-                    })
+                match_count = _count_matches(pattern, content)
+                if match_count:
+                    issues.append(severity, description, match_count, pattern.pattern)
         
-        # Check for performance optimizations
-        optimizations = [
-            (r'StringBuilder', 'StringBuilder usage for string concatenation'),
-            (r'ArrayList<', 'ArrayList usage (preferred over Vector)'),
-            (r'HashMap<', 'HashMap usage (preferred over Hashtable)'),
-            (r'for\s*\(\s*\w+\s+\w+\s*:\s*\w+\s*\)', 'Enhanced for loops'),
-            (r'try\s*\([^)]+\)\s*{', 'Try-with-resources usage'),
-            (r'\.isEmpty\(\)', 'isEmpty() usage instead of size() == 0')
-        ]
+        performance_analysis['issues'] = issues.as_dicts()
         
-        for pattern, description in optimizations:
-            if re.search(pattern, content):
+        # Check for performance optimizations
+        for pattern, description in self.performance_optimizations:
+            if pattern.search(content):
                 performance_analysis['optimizations_found'].append(description)
         
         # Calculate performance score
-        critical_issues = sum(1 for issue in performance_analysis['issues'] if issue['severity'] == 'critical')
-        major_issues = sum(1 for issue in performance_analysis['issues'] if issue['severity'] == 'major')
-        minor_issues = sum(1 for issue in performance_analysis['issues'] if issue['severity'] == 'minor')
+        severity_tally = Counter(issues.severity)
         
-        performance_analysis['performance_score'] = max(0, 100 - (critical_issues * 30) - (major_issues * 15) - (minor_issues * 5))
+        performance_analysis['performance_score'] = max(0, 100 - (severity_tally['critical'] * 30) - (severity_tally['major'] * 15) - (severity_tally['minor'] * 5))
         
         return performance_analysis
     
@@ -372,23 +569,23 @@ class JavaAnalyzer:
         """Calculate adherence to Java best practices"""
         score = 100
         
-        # Check naming conventions
-        if not re.search(r'class\s+[A-Z][a-zA-Z0-9]*', content):
+        # Check naming conventions; the class regex only runs when the keyword occurs
+        if 'class' not in content or not self.practice_patterns['class_naming'].search(content):
             score -= 10  # Class names should start with uppercase
         
-        if re.search(r'[a-z][a-zA-Z0-9]*\s+[A-Z][a-zA-Z0-9]*\s*[=;]', content):
+        if self.practice_patterns['variable_naming'].search(content):
             score -= 10  # Variable names should start with lowercase
         
         # Check for proper exception handling
-        if re.search(r'catch\s*\(\s*Exception\s+\w+\s*\)', content):
+        if self.practice_patterns['generic_catch'].search(content):
             score -= 15  # Catching generic Exception
         
         # Check for resource management
-        if re.search(r'new\s+File(?:Input|Output)Stream', content) and not re.search(r'try\s*\([^)]+\)', content):
+        if self.practice_patterns['file_streams'].search(content) and not self.practice_patterns['try_with_resources'].search(content):
             score -= 20  # Not using try-with-resources
         
         # Check for proper encapsulation
-        public_fields = len(re.findall(r'public\s+(?!static\s+final)\w+\s+\w+\s*[=;]', content))
+        public_fields = _count_matches(self.practice_patterns['public_mutable_fields'], content)
         if public_fields > 0:
             score -= public_fields * 5  # Public fields (not constants)
         
@@ -399,7 +596,7 @@ class JavaAnalyzer:
         issues = []
         
         # OOP-related issues
-        if re.search(r'public\s+\w+\s+\w+\s*[=;]', content) and not re.search(r'public\s+static\s+final', content):
+        if self.practice_patterns['public_fields'].search(content) and not self.practice_patterns['public_constants'].search(content):
             issues.append({
                 'type': 'Encapsulation',
                 'severity': 'Medium',
@@ -408,7 +605,7 @@ class JavaAnalyzer:
             })
         
         # Performance issues
-        if re.search(r'\+\s*=.*?"[^"]*"', content):
+        if self.practice_patterns['string_concatenation'].search(content):
             issues.append({
                 'type': 'Performance',
                 'severity': 'Medium',
@@ -417,7 +614,7 @@ class JavaAnalyzer:
             })
         
         # Exception handling issues
-        if re.search(r'catch\s*\(\s*Exception\s+\w+\s*\)', content):
+        if self.practice_patterns['generic_catch'].search(content):
             issues.append({
                 'type': 'Exception Handling',
                 'severity': 'Low',
@@ -427,51 +624,50 @@ class JavaAnalyzer:
         
         return issues
     
-    def generate_suggestions(self, content):
+    def generate_suggestions(self, content, keyword_counts=None):
         """Generate improvement suggestions"""
+        if keyword_counts is None:
+            keyword_counts = self.scan_keywords(content)
+        
         suggestions = []
         
         # OOP suggestions
-        if not re.search(r'private\s+\w+\s+\w+', content):
+        if not self.practice_patterns['private_fields'].search(content):
             suggestions.append("Use private fields and provide public getter/setter methods for better encapsulation")
         
-        if not re.search(r'@Override', content) and re.search(r'extends\s+\w+', content):
+        # @Override and class extension presence come from the keyword scan
+        has_extension = keyword_counts['class_extension'] or self.practice_patterns['class_extension'].search(content)
+        if not keyword_counts['method_overriding'] and has_extension:
             suggestions.append("Use @Override annotation when overriding methods for better code clarity")
         
         # Performance suggestions
-        if re.search(r'Vector<', content):
+        if self.practice_patterns['vector_usage'].search(content):
             suggestions.append("Consider using ArrayList instead of Vector for better performance")
         
-        if re.search(r'new\s+String\s*\(', content):
+        if self.practice_patterns['string_creation'].search(content):
             suggestions.append("Avoid unnecessary String object creation; use string literals directly")
         
         # Modern Java suggestions
-        if not re.search(r'for\s*\(\s*\w+\s+\w+\s*:\s*\w+\s*\)', content) and re.search(r'for\s*\(\s*int\s+\w+\s*=', content):
+        if not self.practice_patterns['enhanced_for_loop'].search(content) and self.practice_patterns['indexed_for_loop'].search(content):
             suggestions.append("Consider using enhanced for loops (for-each) for better readability")
         
-        if not re.search(r'try\s*\([^)]+\)', content) and re.search(r'new\s+File(?:Input|Output)Stream', content):
+        if not self.practice_patterns['try_with_resources'].search(content) and self.practice_patterns['file_streams'].search(content):
             suggestions.append("Use try-with-resources for automatic resource management")
         
         # Code organization suggestions
-        if not re.search(r'package\s+[\w.]+\s*;', content):
+        if not self.practice_patterns['package_declaration'].search(content):
             suggestions.append("Organize code in packages for better namespace management")
         
-        if not re.search(r'import\s+[\w.]+\s*;', content) and re.search(r'java\.', content):
+        if not self.practice_patterns['import_statement'].search(content) and self.practice_patterns['qualified_names'].search(content):
             suggestions.append("Use import statements instead of fully qualified class names")
         
         return suggestions[:8]  # Limit to top 8 suggestions
     
     def calculate_complexity(self, content):
         """Calculate cyclomatic complexity"""
-        complexity_keywords = [
-            r'\bif\b', r'\belse\b', r'\bwhile\b', r'\bfor\b', 
-            r'\bswitch\b', r'\bcase\b', r'\bcatch\b', r'\b\?\s*.*?:', 
-            r'\b&&\b', r'\b\|\|\b'
-        ]
-        
         complexity = 1  # Base complexity
-        for keyword in complexity_keywords:
-            complexity += len(re.findall(keyword, content))
+        for keyword in self.complexity_patterns:
+            complexity += _count_matches(keyword, content)
         
         return min(complexity, 50)  # Cap at 50
     
@@ -483,7 +679,7 @@ class JavaAnalyzer:
         # Factors affecting maintainability
         avg_line_length = sum(len(line) for line in non_empty_lines) / max(len(non_empty_lines), 1)
         comment_ratio = len([line for line in lines if line.strip().startswith('//')]) / max(len(non_empty_lines), 1)
-        method_count = len(re.findall(r'(?:public|private|protected)\s+(?:static\s+)?\w+\s+\w+\s*\(', content))
+        method_count = _count_matches(self.method_signature_pattern, content)
         
         # Calculate score
         score = 100
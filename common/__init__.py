@@ -0,0 +1,8 @@
+"""
+DevMatch AI - Common Utilities
+Shared helpers used by the analyzer modules
+"""
+
+from .cache import AnalysisCache, cached_by_hash
+
+__all__ = ['AnalysisCache', 'cached_by_hash']
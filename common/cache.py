@@ -0,0 +1,123 @@
+"""
+DevMatch AI - Persistent Analysis Cache
+Opt-in SQLite cache of analyzer results keyed by content hash and analyzer source
+"""
+
+import os
+import sys
+import json
+import hashlib
+import sqlite3
+import threading
+import functools
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMMON_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.environ.get('DEVMATCH_CACHE_DIR', os.path.join(PROJECT_ROOT, '.devmatch_cache'))
+
+
+class AnalysisCache:
+    """Persistent key/value store for JSON-encoded analysis results"""
+    
+    def __init__(self, path, max_entries=10000):
+        self.path = path
+        self.max_entries = max_entries
+        # Off unless DEVMATCH_CACHE=1, so by default every call recomputes its result
+        self.enabled = os.environ.get('DEVMATCH_CACHE', '0') == '1'
+        self.local = threading.local()
+    
+    def connection(self):
+        """Return this thread's connection, creating the table on first use"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute('CREATE TABLE IF NOT EXISTS json_results (key BLOB PRIMARY KEY, value TEXT NOT NULL)')
+            self.local.conn = conn
+        return conn
+    
+    def get(self, key):
+        """Return the cached value for key, or None"""
+        row = self.connection().execute('SELECT value FROM json_results WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def set(self, key, value):
+        """Store value under key, dropping the oldest entries beyond max_entries"""
+        # JSON rather than pickle, so reading a shared cache directory can never execute code
+        data = json.dumps(value)
+        # Values JSON would alter (tuples, non-string keys) are skipped, so a hit always equals a fresh result
+        if json.loads(data) != value:
+            return
+        conn = self.connection()
+        with conn:
+            cursor = conn.execute(
+                'INSERT OR REPLACE INTO json_results (key, value) VALUES (?, ?)',
+                (key, data)
+            )
+            conn.execute('DELETE FROM json_results WHERE rowid <= ?', (cursor.lastrowid - self.max_entries,))
+
+
+default_cache = AnalysisCache(os.path.join(CACHE_DIR, 'analysis.sqlite3'))
+
+
+@functools.lru_cache(maxsize=None)
+def source_fingerprint(directory):
+    """Hash the .py files in directory so code changes invalidate cached results"""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('.py'):
+            digest.update(name.encode('utf-8'))
+            with open(os.path.join(directory, name), 'rb') as file:
+                digest.update(file.read())
+    return digest.digest()
+
+
+def cached_by_hash(namespace, version='v1', cache=None, payload_bytes=None, environment=None):
+    """Cache a method's results on disk, keyed by a hash of its arguments (or of payload_bytes(payload)),
+    the analyzer and cache sources, and environment(self)"""
+    def decorator(func):
+        package_dir = os.path.dirname(os.path.abspath(sys.modules[func.__module__].__file__))
+        
+        @functools.wraps(func)
+        def wrapper(self, payload, *args, **kwargs):
+            store = cache or default_cache
+            if not store.enabled:
+                return func(self, payload, *args, **kwargs)
+            
+            if payload_bytes is not None:
+                try:
+                    data = payload_bytes(payload)
+                except Exception:
+                    return func(self, payload, *args, **kwargs)
+            elif isinstance(payload, bytes):
+                data = payload
+            else:
+                data = str(payload).encode('utf-8', 'surrogatepass')
+            # Runtime state the sources don't capture, such as which optional backends are installed
+            state = environment(self) if environment is not None else None
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(repr((namespace, version, len(data), args, sorted(kwargs.items()), state)).encode('utf-8'))
+            digest.update(source_fingerprint(package_dir))
+            digest.update(source_fingerprint(COMMON_DIR))
+            digest.update(data)
+            key = digest.digest()
+            
+            # The cache must never break an analysis, so storage errors fall through to a recompute
+            try:
+                result = store.get(key)
+            except Exception:
+                result = None
+            if result is not None:
+                return result
+            
+            result = func(self, payload, *args, **kwargs)
+            # Empty results and error dicts mark failures (e.g. an unreadable upload), which are retried next time
+            if result and not (isinstance(result, dict) and result.get('error')):
+                try:
+                    store.set(key, result)
+                except Exception:
+                    pass
+            return result
+        
+        return wrapper
+    return decorator
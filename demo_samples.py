@@ -0,0 +1,327 @@
+"""
+DevMatch AI - Demo Samples
+Sample resume, code snippets and portfolio page used by demo.py
+"""
+
+SAMPLE_RESUME = """
+        John Smith
+        Senior Software Developer
+        Email: john.smith@email.com
+        Phone: (555) 123-4567
+        
+        PROFESSIONAL SUMMARY
+        Experienced software developer with 5+ years in full-stack development.
+        Expertise in Python, JavaScript, React, Node.js, and cloud technologies.
+        
+        TECHNICAL SKILLS
+        • Programming Languages: Python, JavaScript, TypeScript, Java, Go
+        • Frontend: React, Vue.js, HTML5, CSS3, Bootstrap
+        • Backend: Node.js, Django, Flask, Express.js
+        • Databases: PostgreSQL, MongoDB, Redis
+        • Cloud: AWS, Docker, Kubernetes
+        • Tools: Git, Jenkins, JIRA
+        
+        PROFESSIONAL EXPERIENCE
+        
+        Senior Software Developer | TechCorp Inc. | 2020 - Present
+        • Led development of microservices architecture serving 1M+ users
+        • Implemented CI/CD pipelines reducing deployment time by 60%
+        • Mentored 3 junior developers and conducted code reviews
+        • Technologies: Python, React, AWS, Docker, PostgreSQL
+        
+        Software Developer | StartupXYZ | 2018 - 2020
+        • Developed responsive web applications using React and Node.js
+        • Optimized database queries improving performance by 40%
+        • Collaborated with cross-functional teams in Agile environment
+        • Technologies: JavaScript, React, Node.js, MongoDB
+        
+        EDUCATION
+        Bachelor of Science in Computer Science
+        University of Technology | 2014 - 2018
+        
+        CERTIFICATIONS
+        • AWS Certified Solutions Architect
+        • Certified Kubernetes Administrator
+        """
+
+SAMPLE_LANGUAGES = {
+    'Python': {
+        'extension': '.py',
+        'code': '''
+def fibonacci(n):
+    """Calculate fibonacci number using memoization."""
+    memo = {}
+    
+    def fib_helper(n):
+        if n in memo:
+            return memo[n]
+        if n <= 1:
+            return n
+        memo[n] = fib_helper(n-1) + fib_helper(n-2)
+        return memo[n]
+    
+    return fib_helper(n)
+
+class Calculator:
+    """A simple calculator with history."""
+    
+    def __init__(self):
+        self.history = []
+    
+    def add(self, a: float, b: float) -> float:
+        """Add two numbers and store in history."""
+        result = a + b
+        self.history.append(('add', a, b, result))
+        return result
+    
+    def get_history(self):
+        """Return calculation history."""
+        return self.history.copy()
+
+if __name__ == "__main__":
+    calc = Calculator()
+    result = calc.add(10, 5)
+    print(f"Result: {result}")
+    print(f"Fibonacci(10): {fibonacci(10)}")
+                '''
+    },
+    'C++': {
+        'extension': '.cpp',
+        'code': '''
+#include <iostream>
+#include <memory>
+#include <vector>
+#include <algorithm>
+
+class Calculator {
+private:
+    std::vector<double> history;
+    
+public:
+    explicit Calculator() {
+        history.reserve(100);
+    }
+    
+    virtual ~Calculator() = default;
+    
+    double add(const double& a, const double& b) {
+        double result = a + b;
+        history.push_back(result);
+        return result;
+    }
+    
+    const std::vector<double>& getHistory() const {
+        return history;
+    }
+    
+    void clearHistory() {
+        history.clear();
+    }
+};
+
+int main() {
+    auto calc = std::make_unique<Calculator>();
+    
+    double result = calc->add(10.5, 5.3);
+    std::cout << "Result: " << result << std::endl;
+    
+    return 0;
+}
+                '''
+    },
+    'Java': {
+        'extension': '.java',
+        'code': '''
+package com.devmatch.calculator;
+
+import java.util.ArrayList;
+import java.util.List;
+
+public class Calculator {
+    private List<Double> history;
+    private static final String VERSION = "2.0";
+    
+    public Calculator() {
+        this.history = new ArrayList<>();
+    }
+    
+    public double add(double a, double b) {
+        double result = a + b;
+        history.add(result);
+        return result;
+    }
+    
+    public double multiply(double a, double b) {
+        double result = a * b;
+        history.add(result);
+        return result;
+    }
+    
+    public List<Double> getHistory() {
+        return new ArrayList<>(history);
+    }
+    
+    public void clearHistory() {
+        history.clear();
+    }
+    
+    @Override
+    public String toString() {
+        return "Calculator v" + VERSION + " with " + history.size() + " operations";
+    }
+    
+    public static void main(String[] args) {
+        Calculator calc = new Calculator();
+        
+        try {
+            double result1 = calc.add(10.0, 5.0);
+            double result2 = calc.multiply(result1, 2.0);
+            
+            System.out.println("Results: " + calc.getHistory());
+            System.out.println(calc.toString());
+        } catch (Exception e) {
+            System.err.println("Error: " + e.getMessage());
+        }
+    }
+}
+                '''
+    },
+    'Go': {
+        'extension': '.go',
+        'code': '''
+package main
+
+import (
+    "context"
+    "fmt"
+    "sync"
+    "time"
+)
+
+type Calculator struct {
+    history []float64
+    mutex   sync.RWMutex
+}
+
+func NewCalculator() *Calculator {
+    return &Calculator{
+        history: make([]float64, 0, 100),
+    }
+}
+
+func (c *Calculator) Add(a, b float64) float64 {
+    result := a + b
+    
+    c.mutex.Lock()
+    c.history = append(c.history, result)
+    c.mutex.Unlock()
+    
+    return result
+}
+
+func (c *Calculator) GetHistory() []float64 {
+    c.mutex.RLock()
+    defer c.mutex.RUnlock()
+    
+    history := make([]float64, len(c.history))
+    copy(history, c.history)
+    return history
+}
+
+func (c *Calculator) ProcessAsync(ctx context.Context, operations <-chan [2]float64, results chan<- float64) {
+    defer close(results)
+    
+    for {
+        select {
+        case op, ok := <-operations:
+            if !ok {
+                return
+            }
+            result := c.Add(op[0], op[1])
+            
+            select {
+            case results <- result:
+            case <-ctx.Done():
+                return
+            }
+            
+        case <-ctx.Done():
+            return
+        }
+    }
+}
+
+func main() {
+    calc := NewCalculator()
+    
+    ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
+    defer cancel()
+    
+    operations := make(chan [2]float64, 5)
+    results := make(chan float64, 5)
+    
+    go calc.ProcessAsync(ctx, operations, results)
+    
+    // Send operations
+    operations <- [2]float64{10.5, 5.3}
+    operations <- [2]float64{20.0, 3.7}
+    close(operations)
+    
+    // Collect results
+    for result := range results {
+        fmt.Printf("Result: %.2f\\n", result)
+    }
+    
+    fmt.Printf("History: %v\\n", calc.GetHistory())
+}
+                '''
+    }
+}
+
+SAMPLE_PORTFOLIO_HTML = '''
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>John Smith - Portfolio</title>
+            <link rel="stylesheet" href="styles.css">
+        </head>
+        <body>
+            <header>
+                <nav>
+                    <ul>
+                        <li><a href="#home">Home</a></li>
+                        <li><a href="#about">About</a></li>
+                        <li><a href="#projects">Projects</a></li>
+                        <li><a href="#contact">Contact</a></li>
+                    </ul>
+                </nav>
+            </header>
+            
+            <main>
+                <section id="home">
+                    <h1>Welcome to My Portfolio</h1>
+                    <img src="profile.jpg" alt="John Smith - Software Developer">
+                    <p>I'm a passionate full-stack developer with expertise in modern web technologies.</p>
+                </section>
+                
+                <section id="projects">
+                    <h2>My Projects</h2>
+                    <article class="project">
+                        <h3>E-commerce Platform</h3>
+                        <p>Built with React, Node.js, and PostgreSQL</p>
+                    </article>
+                    <article class="project">
+                        <h3>Task Management App</h3>
+                        <p>Developed using Vue.js and Firebase</p>
+                    </article>
+                </section>
+            </main>
+            
+            <footer>
+                <p>&copy; 2024 John Smith. All rights reserved.</p>
+            </footer>
+        </body>
+        </html>
+        '''
@@ -3,6 +3,22 @@ DevMatch AI - Job Matcher Module
 Intelligent job matching based on skills and experience analysis
 """
 
-from .job_recommender import JobRecommender
+from functools import lru_cache
 
-__all__ = ['JobRecommender']
\ No newline at end of file
+
+def __getattr__(name):
+    """Import the recommender module only when it is first needed"""
+    if name == 'JobRecommender':
+        from .job_recommender import JobRecommender
+        return JobRecommender
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def get_recommender():
+    """Return the shared job recommender instance, built on first use"""
+    from .job_recommender import JobRecommender
+    return JobRecommender()
+
+
+__all__ = ['JobRecommender', 'get_recommender']
@@ -3,17 +3,175 @@ DevMatch AI - Job Recommender Module
 Intelligent job matching based on skills and experience analysis
 """
 
+import os
 import json
-import random
+import heapq
+import bisect
+import operator
 from datetime import datetime
 from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import re
+import numpy as np
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+
+if hasattr(int, 'bit_count'):
+    popcount = int.bit_count
+else:
+    def popcount(value):
+        """Count set bits (int.bit_count is only available from Python 3.10)"""
+        return bin(value).count('1')
+
+
+def posted_date_label(days_ago):
+    """Describe how long ago a listing was posted"""
+    if days_ago == 1:
+        return "1 day ago"
+    elif days_ago < 7:
+        return f"{days_ago} days ago"
+    elif days_ago < 14:
+        return "1 week ago"
+    elif days_ago < 21:
+        return "2 weeks ago"
+    else:
+        return "3+ weeks ago"
+
+
+# Listings are posted 1-30 days ago, so their labels are a table lookup
+POSTED_DATE_LABELS = tuple(posted_date_label(days_ago) for days_ago in range(31))
+
+
+class JobListing:
+    """A generated job listing; converted to a dict only for the listings returned"""
+    __slots__ = ('title', 'company', 'location', 'salary_range', 'match_score', 'required_skills',
+                 'description', 'experience_level', 'posted_date', 'job_type', 'remote_friendly')
+    
+    def __init__(self, title, company, location, salary_range, match_score, required_skills,
+                 description, experience_level, posted_date, job_type, remote_friendly):
+        self.title = title
+        self.company = company
+        self.location = location
+        self.salary_range = salary_range
+        self.match_score = match_score
+        self.required_skills = required_skills
+        self.description = description
+        self.experience_level = experience_level
+        self.posted_date = posted_date
+        self.job_type = job_type
+        self.remote_friendly = remote_friendly
+    
+    def as_dict(self):
+        """Return the listing as the dict shape used by the API"""
+        return {
+            'title': self.title,
+            'company': self.company,
+            'location': self.location,
+            'salary_range': self.salary_range,
+            'match_score': self.match_score,
+            'required_skills': self.required_skills,
+            'description': self.description,
+            'experience_level': self.experience_level,
+            'posted_date': self.posted_date,
+            'job_type': self.job_type,
+            'remote_friendly': self.remote_friendly
+        }
+
 
 class JobRecommender:
-    def __init__(self):
+    __slots__ = ('job_database', 'skill_weights', 'location_multipliers', 'job_types',
+                 'required_norms', 'preferred_norms', 'skill_vocabulary', 'skill_ids',
+                 'required_matrix', 'preferred_matrix', 'experience_bonuses', 'user_skill_masks',
+                 'score_cache', 'vocabulary_text', 'vocabulary_starts', 'skill_automaton', 'ann_index',
+                 'job_rows', 'required_masks', 'preferred_masks', 'salary_table', 'rng')
+    
+    # Reference skill lists for bonuses and market insights, as sets for membership tests
+    BONUS_SKILLS = frozenset(['react', 'python', 'aws', 'docker', 'kubernetes', 'machine learning', 'typescript'])
+    HIGH_DEMAND_SKILLS = frozenset(['python', 'javascript', 'react', 'aws', 'docker', 'kubernetes', 'machine learning'])
+    MEDIUM_DEMAND_SKILLS = frozenset(['java', 'node.js', 'angular', 'vue', 'sql', 'mongodb', 'git'])
+    FRONTEND_PATH_SKILLS = frozenset(['html', 'css', 'javascript', 'react', 'vue', 'angular'])
+    BACKEND_PATH_SKILLS = frozenset(['python', 'java', 'node.js', 'sql', 'api'])
+    DATA_PATH_SKILLS = frozenset(['python', 'r', 'sql', 'machine learning', 'statistics'])
+    
+    # Growth area categories in suggestion order, with set views for counting overlaps
+    SKILL_CATEGORIES = {
+        'frontend': ('html', 'css', 'javascript', 'react', 'vue', 'angular'),
+        'backend': ('python', 'java', 'node.js', 'sql', 'api'),
+        'cloud': ('aws', 'azure', 'gcp', 'docker', 'kubernetes'),
+        'data': ('python', 'r', 'machine learning', 'sql', 'pandas'),
+        'mobile': ('swift', 'kotlin', 'react native', 'flutter')
+    }
+    SKILL_CATEGORY_SETS = {category: frozenset(skills) for category, skills in SKILL_CATEGORIES.items()}
+    TRENDING_SKILLS = ('machine learning', 'docker', 'kubernetes', 'typescript', 'graphql')
+    
+    # Canonical experience levels by folded spelling, plus the common casings so most lookups skip the folding
+    EXPERIENCE_LEVEL_MAP = {
+        'junior': 'junior',
+        'entry': 'junior',
+        'entry-level': 'junior',
+        'mid': 'mid',
+        'mid-level': 'mid',
+        'middle': 'mid',
+        'senior': 'senior',
+        'lead': 'senior',
+        'principal': 'senior'
+    }
+    EXPERIENCE_LEVEL_SPELLINGS = {
+        spelling: level
+        for key, level in EXPERIENCE_LEVEL_MAP.items()
+        for base in (key, key.replace('-', ' '))
+        for spelling in (base, base.title(), base.capitalize(), base.upper())
+    }
+    
+    # The catalog and its skill index are the same for every instance, so they are built once per class
+    CATALOG_ATTRIBUTES = ('job_database', 'skill_weights', 'location_multipliers', 'job_types',
+                          'required_norms', 'preferred_norms', 'skill_vocabulary', 'skill_ids',
+                          'required_matrix', 'preferred_matrix', 'experience_bonuses',
+                          'vocabulary_text', 'vocabulary_starts', 'skill_automaton', 'ann_index',
+                          'job_rows', 'required_masks', 'preferred_masks', 'salary_table')
+    shared_catalog = None
+    
+    # Batches smaller than this are served inline; a thread pool only pays off past it
+    BATCH_PARALLEL_THRESHOLD = 8
+    
+    # Past this many job types, Faiss shortlists the best-scoring rows before the exact scoring pass
+    ANN_MIN_JOBS = 10000
+    ANN_CANDIDATES = 50
+    
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+        # Read from this class's own __dict__ so a subclass with its own loaders never reuses a parent's catalog
+        catalog = type(self).__dict__.get('shared_catalog')
+        if catalog is None:
+            self.build_catalog()
+        else:
+            for name, value in catalog.items():
+                setattr(self, name, value)
+            self.reset_caches()
+    
+    def build_catalog(self):
+        """Load the catalog, build its indexes and publish them as the class's shared catalog"""
         self.load_job_database()
         self.load_skill_weights()
         self.load_salary_data()
+        self.build_skill_index()
+        self.build_salary_table()
+        type(self).shared_catalog = {name: getattr(self, name) for name in self.CATALOG_ATTRIBUTES}
     
     def load_job_database(self):
         """Load comprehensive job database"""
@@ -173,6 +331,198 @@ class JobRecommender:
             'Default': 0.9
         }
     
+    def build_skill_index(self):
+        """Index job skills as rows of per-job skill count matrices for vectorized scoring"""
+        jobs = list(self.job_database.values())
+        self.job_types = list(self.job_database)
+        # Divisors for the match ratios; empty lists have zero hits, so clamping keeps their score at 0
+        self.required_norms = np.array([max(len(job['required_skills']), 1) for job in jobs], dtype=np.float64)
+        self.preferred_norms = np.array([max(len(job['preferred_skills']), 1) for job in jobs], dtype=np.float64)
+        
+        vocabulary = set()
+        for job in jobs:
+            vocabulary.update(skill.lower() for skill in job['required_skills'] + job['preferred_skills'])
+        self.skill_vocabulary = sorted(vocabulary)
+        self.skill_ids = {skill: index for index, skill in enumerate(self.skill_vocabulary)}
+        self.build_skill_matchers()
+        
+        self.required_matrix = self.build_skill_matrix(jobs, 'required_skills')
+        self.preferred_matrix = self.build_skill_matrix(jobs, 'preferred_skills')
+        
+        levels = {level for job in jobs for level in job['experience_levels']}
+        self.experience_bonuses = {
+            level: np.array([10 if level in job['experience_levels'] else 0 for job in jobs], dtype=np.float64)
+            for level in levels
+        }
+        self.ann_index = self.build_ann_index()
+        
+        # Per-row skill bitmasks, kept beside the catalog rather than in its job dicts; bit i is
+        # skill_vocabulary[i], and lists with repeated skills get None to keep the per-entry count path
+        self.job_rows = {id(job): row for row, job in enumerate(jobs)}
+        self.required_masks = []
+        self.preferred_masks = []
+        for job in jobs:
+            for key, masks in (('required_skills', self.required_masks), ('preferred_skills', self.preferred_masks)):
+                skills = {skill.lower() for skill in job[key]}
+                masks.append(self.skills_to_mask(skills) if len(skills) == len(job[key]) else None)
+        self.reset_caches()
+    
+    def build_salary_table(self):
+        """Format every job's salary range per experience level and listed location ahead of time"""
+        self.salary_table = {
+            job_type: {
+                (level, location): self.format_salary_range(job, level, location)
+                for level in job['experience_levels']
+                for location in job['locations']
+            }
+            for job_type, job in self.job_database.items()
+        }
+    
+    def reset_caches(self):
+        """Start this instance's user-skill and score memos afresh"""
+        self.user_skill_masks = {}
+        
+        # Scores only depend on the skill multiset and level, so they are memoized per index build
+        self.score_cache = lru_cache(maxsize=1024)(self.score_jobs)
+    
+    def reload(self):
+        """Rebuild all catalog state and republish it for new instances, dropping memoized scores;
+        other existing instances keep the catalog they were built with"""
+        self.build_catalog()
+    
+    def build_ann_index(self):
+        """Build a Faiss inner-product index whose scores match score_jobs before skill bonuses"""
+        if not FAISS_AVAILABLE or len(self.job_types) <= self.ANN_MIN_JOBS:
+            return None
+        
+        # Skill columns carry each job's per-skill weight, level columns its experience bonus
+        weights = np.hstack([
+            self.required_matrix * (70 / self.required_norms)[:, np.newaxis]
+            + self.preferred_matrix * (30 / self.preferred_norms)[:, np.newaxis],
+            np.column_stack([self.experience_bonuses[level] for level in sorted(self.experience_bonuses)])
+        ]).astype(np.float32)
+        
+        index = faiss.IndexFlatIP(weights.shape[1])
+        index.add(weights)
+        return index
+    
+    def ann_candidates(self, user_skills, experience_level):
+        """Return the rows of the best-scoring job types for a user, in job database order"""
+        levels = [level == experience_level for level in sorted(self.experience_bonuses)]
+        query = np.concatenate([self.skill_membership(user_skills), levels]).astype(np.float32)
+        _, rows = self.ann_index.search(query[np.newaxis, :], self.ANN_CANDIDATES)
+        return np.sort(rows[0][rows[0] >= 0])
+    
+    def build_skill_matchers(self):
+        """Prepare substring lookups over the vocabulary in both directions"""
+        # User skill inside vocabulary skills: a single find() scan over the NUL-joined vocabulary
+        self.vocabulary_text = '\0'.join(self.skill_vocabulary)
+        self.vocabulary_starts = []
+        position = 0
+        for skill in self.skill_vocabulary:
+            self.vocabulary_starts.append(position)
+            position += len(skill) + 1
+        
+        # Vocabulary skills inside a user skill: one Aho-Corasick pass when pyahocorasick is installed
+        self.skill_automaton = None
+        if AHOCORASICK_AVAILABLE and all(self.skill_vocabulary):
+            self.skill_automaton = ahocorasick.Automaton()
+            for index, skill in enumerate(self.skill_vocabulary):
+                self.skill_automaton.add_word(skill, index)
+            self.skill_automaton.make_automaton()
+    
+    def job_row(self, job_data):
+        """Return the index row of a job dict from this catalog, or None for any other dict"""
+        row = self.job_rows.get(id(job_data))
+        if row is not None and self.job_database.get(self.job_types[row]) is job_data:
+            return row
+        return None
+    
+    def skills_to_mask(self, skills):
+        """Return the vocabulary bitmask of the given lowercase skills"""
+        mask = 0
+        for skill in skills:
+            mask |= 1 << self.skill_ids[skill]
+        return mask
+    
+    def user_skill_mask(self, user_skill):
+        """Return the bitmask of vocabulary skills matched by user_skill (substring either way), memoized"""
+        mask = self.user_skill_masks.get(user_skill)
+        if mask is None:
+            mask = 0
+            if self.skill_automaton is not None:
+                for _, index in self.skill_automaton.iter(user_skill):
+                    mask |= 1 << index
+            else:
+                for index, skill in enumerate(self.skill_vocabulary):
+                    if skill in user_skill:
+                        mask |= 1 << index
+            
+            if not user_skill:
+                mask = (1 << len(self.skill_vocabulary)) - 1
+            elif '\0' not in user_skill:
+                # Without a NUL the pattern cannot span two skills; continue from the next skill after a hit
+                position = self.vocabulary_text.find(user_skill)
+                while position != -1:
+                    index = bisect.bisect_right(self.vocabulary_starts, position) - 1
+                    mask |= 1 << index
+                    if index + 1 == len(self.vocabulary_starts):
+                        break
+                    position = self.vocabulary_text.find(user_skill, self.vocabulary_starts[index + 1])
+            
+            # Unbounded user input must not grow the memo forever
+            if len(self.user_skill_masks) >= 4096:
+                self.user_skill_masks.clear()
+            self.user_skill_masks[user_skill] = mask
+        return mask
+    
+    def user_skills_mask(self, user_skills):
+        """Return the bitmask of vocabulary skills matched by any of the user's skills"""
+        mask = 0
+        for user_skill in user_skills:
+            mask |= self.user_skill_mask(user_skill)
+        return mask
+    
+    def build_skill_matrix(self, jobs, key):
+        """Build a (jobs x vocabulary) int8 matrix counting each job's listed skills"""
+        matrix = np.zeros((len(jobs), len(self.skill_vocabulary)), dtype=np.int8)
+        for row, job in enumerate(jobs):
+            # Repeated entries count once per listing, as in calculate_match_score
+            for skill in job[key]:
+                matrix[row, self.skill_ids[skill.lower()]] += 1
+        return matrix
+    
+    def skill_membership(self, user_skills):
+        """Mark vocabulary skills matched by any user skill (substring either way)"""
+        size = len(self.skill_vocabulary)
+        mask_bytes = self.user_skills_mask(user_skills).to_bytes((size + 7) // 8, 'little')
+        bits = np.unpackbits(np.frombuffer(mask_bytes, dtype=np.uint8), bitorder='little')[:size]
+        return bits.view(np.int8)
+    
+    def count_skill_hits(self, matrix, membership):
+        """Count matched skills per job row, using SimSIMD's int8 dot-product kernels when installed"""
+        if SIMSIMD_AVAILABLE:
+            return np.asarray(simsimd.cdist(membership[np.newaxis, :], matrix, metric='dot'))[0]
+        # Summing only the matched columns keeps the matrix int8 instead of widening all of it for a matmul
+        return matrix[:, np.flatnonzero(membership)].sum(axis=1, dtype=np.int32)
+    
+    def score_jobs(self, user_skills, experience_level, rows=None):
+        """Score every job type (or only the given rows) in one pass, in job database order"""
+        membership = self.skill_membership(user_skills)
+        rows = slice(None) if rows is None else rows
+        required_hits = self.count_skill_hits(self.required_matrix[rows], membership)
+        preferred_hits = self.count_skill_hits(self.preferred_matrix[rows], membership)
+        exp_bonus = self.experience_bonuses.get(experience_level, np.zeros(len(self.job_types)))[rows]
+        
+        required_score = required_hits / self.required_norms[rows] * 70
+        preferred_score = preferred_hits / self.preferred_norms[rows] * 30
+        total_score = required_score + preferred_score + exp_bonus
+        
+        # Skill bonuses don't depend on the job, so they are added once
+        bonus_score = self.calculate_skill_bonuses(user_skills, None)
+        
+        return np.minimum(total_score + bonus_score, 100).tolist()
+    
     def recommend_jobs(self, skills, experience_level='Mid-level', years_experience=3, location_preference=None):
         """Generate job recommendations based on skills and experience"""
         try:
@@ -180,53 +530,71 @@ class JobRecommender:
             skills_lower = [skill.lower() for skill in skills]
             exp_level = self.normalize_experience_level(experience_level)
             
+            # With no vocabulary overlap a job scores at most 10 (level) + 15 (bonus), below the threshold
+            if not self.user_skills_mask(skills_lower):
+                return []
+            
             # Calculate job matches
             job_matches = []
+            if self.ann_index is not None:
+                rows = self.ann_candidates(skills_lower, exp_level)
+                jobs = [self.job_database[self.job_types[row]] for row in rows]
+                match_scores = self.score_jobs(skills_lower, exp_level, rows)
+            else:
+                jobs = self.job_database.values()
+                match_scores = self.score_cache(tuple(sorted(skills_lower)), exp_level)
             
-            for job_type, job_data in self.job_database.items():
-                match_score = self.calculate_match_score(skills_lower, job_data, exp_level)
-                
+            for job_data, match_score in zip(jobs, match_scores):
                 if match_score >= 30:  # Minimum threshold
-                    jobs = self.generate_job_listings(job_data, exp_level, match_score, location_preference)
-                    job_matches.extend(jobs)
+                    listings = self._generate_job_records(job_data, exp_level, match_score, location_preference)
+                    job_matches.extend(listings)
             
-            # Sort by match score and return top matches
-            job_matches.sort(key=lambda x: x['match_score'], reverse=True)
+            # Select the top matches by score; equivalent to a stable descending sort sliced to 10
+            top_matches = heapq.nlargest(10, job_matches, key=operator.attrgetter('match_score'))
             
-            return job_matches[:10]  # Return top 10 matches
+            return [job.as_dict() for job in top_matches]  # Return top 10 matches
             
         except Exception as e:
             print(f"Job recommendation error: {e}")
             return self.get_fallback_recommendations()
     
+    def recommend_jobs_batch(self, users, max_workers=None):
+        """Recommend jobs for many users, each given as a dict of recommend_jobs keyword arguments"""
+        users = list(users)
+        if len(users) < self.BATCH_PARALLEL_THRESHOLD:
+            return [self.recommend_jobs(**user) for user in users]
+        
+        workers = max_workers or min(len(users), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda user: self.recommend_jobs(**user), users))
+    
     def normalize_experience_level(self, experience_level):
         """Normalize experience level to standard format"""
-        level_map = {
-            'junior': 'junior',
-            'entry': 'junior',
-            'entry-level': 'junior',
-            'mid': 'mid',
-            'mid-level': 'mid',
-            'middle': 'mid',
-            'senior': 'senior',
-            'lead': 'senior',
-            'principal': 'senior'
-        }
-        
-        return level_map.get(experience_level.lower().replace(' ', '-'), 'mid')
+        level = self.EXPERIENCE_LEVEL_SPELLINGS.get(experience_level)
+        if level is not None:
+            return level
+        return self.EXPERIENCE_LEVEL_MAP.get(experience_level.lower().replace(' ', '-'), 'mid')
     
     def calculate_match_score(self, user_skills, job_data, experience_level):
         """Calculate how well user skills match job requirements"""
-        required_skills = [skill.lower() for skill in job_data['required_skills']]
-        preferred_skills = [skill.lower() for skill in job_data['preferred_skills']]
-        
-        # Calculate required skills match
-        required_matches = sum(1 for skill in required_skills if any(user_skill in skill or skill in user_skill for user_skill in user_skills))
-        required_score = (required_matches / len(required_skills)) * 70 if required_skills else 0
+        # Indexed jobs were lowercased into their masks at load time and count matches with a popcount;
+        # other job dicts fall back to the pairwise scan
+        row = self.job_row(job_data)
+        if row is not None and self.required_masks[row] is not None and self.preferred_masks[row] is not None:
+            user_mask = self.user_skills_mask(user_skills)
+            required_matches = popcount(user_mask & self.required_masks[row])
+            preferred_matches = popcount(user_mask & self.preferred_masks[row])
+        else:
+            required_skills = [skill.lower() for skill in job_data['required_skills']]
+            preferred_skills = [skill.lower() for skill in job_data['preferred_skills']]
+            required_matches = sum(1 for skill in required_skills if any(user_skill in skill or skill in user_skill for user_skill in user_skills))
+            preferred_matches = sum(1 for skill in preferred_skills if any(user_skill in skill or skill in user_skill for user_skill in user_skills))
         
-        # Calculate preferred skills match
-        preferred_matches = sum(1 for skill in preferred_skills if any(user_skill in skill or skill in user_skill for user_skill in user_skills))
-        preferred_score = (preferred_matches / len(preferred_skills)) * 30 if preferred_skills else 0
+        # Calculate required and preferred skills match
+        required_total = len(job_data['required_skills'])
+        preferred_total = len(job_data['preferred_skills'])
+        required_score = (required_matches / required_total) * 70 if required_total else 0
+        preferred_score = (preferred_matches / preferred_total) * 30 if preferred_total else 0
         
         # Experience level bonus
         exp_bonus = 0
@@ -242,68 +610,76 @@ class JobRecommender:
     
     def calculate_skill_bonuses(self, user_skills, job_data):
         """Calculate bonus points for high-value skills"""
-        bonus = 0
-        
-        # High-demand skills bonus
-        high_demand_skills = ['react', 'python', 'aws', 'docker', 'kubernetes', 'machine learning', 'typescript']
-        
-        for skill in user_skills:
-            if skill in high_demand_skills:
-                bonus += 2
+        # High-demand skills bonus (repeated skills count each time)
+        bonus = 2 * sum(map(self.BONUS_SKILLS.__contains__, user_skills))
         
         return min(15, bonus)  # Cap bonus at 15 points
     
     def generate_job_listings(self, job_data, experience_level, match_score, location_preference=None):
         """Generate specific job listings for a job type"""
-        jobs = []
-        
-        # Generate 1-3 jobs per job type based on match score
-        num_jobs = 3 if match_score >= 80 else 2 if match_score >= 60 else 1
-        
-        for _ in range(num_jobs):
-            job = self.create_job_listing(job_data, experience_level, match_score, location_preference)
-            jobs.append(job)
-        
-        return jobs
+        return [job.as_dict() for job in self._generate_job_records(job_data, experience_level, match_score, location_preference)]
     
     def create_job_listing(self, job_data, experience_level, match_score, location_preference=None):
         """Create a single job listing"""
-        # Select random elements for variety
-        title = random.choice(job_data['titles'])
-        company = random.choice(job_data['companies'])
-        description = random.choice(job_data['descriptions'])
-        
-        # Select location
-        if location_preference and location_preference in job_data['locations']:
-            location = location_preference
-        else:
-            location = random.choice(job_data['locations'])
-        
-        # Calculate salary range
-        salary_range = self.calculate_salary_range(job_data, experience_level, location)
-        
-        # Select required skills (subset for display)
-        required_skills = random.sample(
-            job_data['required_skills'] + job_data['preferred_skills'][:3], 
-            min(6, len(job_data['required_skills']) + 3)
-        )
+        return self._create_job_records(job_data, experience_level, match_score, 1, location_preference)[0].as_dict()
+    
+    def _generate_job_records(self, job_data, experience_level, match_score, location_preference=None):
+        """Generate a job type's listings as JobListing records; recommend_jobs converts only those it returns"""
+        # Generate 1-3 jobs per job type based on match score
+        num_jobs = 3 if match_score >= 80 else 2 if match_score >= 60 else 1
         
-        return {
-            'title': title,
-            'company': company,
-            'location': location,
-            'salary_range': salary_range,
-            'match_score': int(match_score),
-            'required_skills': [skill.title() for skill in required_skills],
-            'description': description,
-            'experience_level': experience_level.title(),
-            'posted_date': self.generate_posted_date(),
-            'job_type': 'Full-time',
-            'remote_friendly': location == 'Remote' or random.choice([True, False])
-        }
+        return self._create_job_records(job_data, experience_level, match_score, num_jobs, location_preference)
+    
+    def _create_job_records(self, job_data, experience_level, match_score, count, location_preference=None):
+        """Create count JobListing records from a single batched draw of uniform random numbers"""
+        titles = job_data['titles']
+        companies = job_data['companies']
+        descriptions = job_data['descriptions']
+        locations = job_data['locations']
+        fixed_location = location_preference if location_preference and location_preference in locations else None
+        
+        # Skills subset for display: ranking a row of random keys gives a uniform sample without replacement
+        skill_pool = job_data['required_skills'] + job_data['preferred_skills'][:3]
+        display_skills = [skill.title() for skill in skill_pool]
+        sample_size = min(6, len(job_data['required_skills']) + 3, len(skill_pool))
+        
+        # Fields shared by every listing in the batch are computed once
+        score = int(match_score)
+        level_name = experience_level.title()
+        
+        # Columns: title, company, description, location, posted days, remote flag, then one key per pool skill
+        draws = self.rng.random((count, 6 + len(skill_pool)))
+        skill_picks = draws[:, 6:].argsort(axis=1)[:, :sample_size].tolist()
+        
+        listings = []
+        for row, picks in zip(draws[:, :6].tolist(), skill_picks):
+            location = fixed_location or locations[int(row[3] * len(locations))]
+            listings.append(JobListing(
+                title=titles[int(row[0] * len(titles))],
+                company=companies[int(row[1] * len(companies))],
+                location=location,
+                salary_range=self.calculate_salary_range(job_data, experience_level, location),
+                match_score=score,
+                required_skills=[display_skills[index] for index in picks],
+                description=descriptions[int(row[2] * len(descriptions))],
+                experience_level=level_name,
+                posted_date=POSTED_DATE_LABELS[1 + int(row[4] * 30)],
+                job_type='Full-time',
+                remote_friendly=location == 'Remote' or row[5] < 0.5
+            ))
+        return listings
     
     def calculate_salary_range(self, job_data, experience_level, location):
         """Calculate salary range based on experience and location"""
+        row = self.job_row(job_data)
+        if row is not None:
+            salary_range = self.salary_table[self.job_types[row]].get((experience_level, location))
+            if salary_range is not None:
+                return salary_range
+        return self.format_salary_range(job_data, experience_level, location)
+    
+    def format_salary_range(self, job_data, experience_level, location):
+        """Format the salary range string for a job, experience level and location"""
         if experience_level not in job_data['experience_levels']:
             experience_level = 'mid'  # Default
         
@@ -315,43 +691,39 @@ class JobRecommender:
         
         return f"${min_salary:,} - ${max_salary:,}"
     
-    def generate_posted_date(self):
+    def generate_posted_date(self, days_ago=None):
         """Generate a realistic posted date"""
-        days_ago = random.randint(1, 30)
-        if days_ago == 1:
-            return "1 day ago"
-        elif days_ago < 7:
-            return f"{days_ago} days ago"
-        elif days_ago < 14:
-            return "1 week ago"
-        elif days_ago < 21:
-            return "2 weeks ago"
-        else:
-            return "3+ weeks ago"
+        if days_ago is None:
+            days_ago = 1 + int(self.rng.random() * 30)
+        if 0 <= days_ago < len(POSTED_DATE_LABELS):
+            return POSTED_DATE_LABELS[days_ago]
+        return posted_date_label(days_ago)
     
     def get_market_insights(self, skills, experience_level):
         """Get market insights for given skills and experience"""
+        skill_set = self.normalize_skills(skills)
         insights = {
             'skill_demand': self.analyze_skill_demand(skills),
             'salary_trends': self.get_salary_trends(experience_level),
-            'growth_areas': self.identify_growth_areas(skills),
-            'recommendations': self.get_career_recommendations(skills, experience_level)
+            'growth_areas': self.growth_areas_for(skill_set),
+            'recommendations': self.career_paths_for(skill_set, experience_level)
         }
         
         return insights
     
+    def normalize_skills(self, skills):
+        """Return the user's skills as a lowercase frozenset, shared by the insight helpers"""
+        return frozenset(skill.lower() for skill in skills)
+    
     def analyze_skill_demand(self, skills):
         """Analyze demand for user's skills"""
-        high_demand = ['python', 'javascript', 'react', 'aws', 'docker', 'kubernetes', 'machine learning']
-        medium_demand = ['java', 'node.js', 'angular', 'vue', 'sql', 'mongodb', 'git']
-        
         skill_analysis = {}
         
         for skill in skills:
             skill_lower = skill.lower()
-            if skill_lower in high_demand:
+            if skill_lower in self.HIGH_DEMAND_SKILLS:
                 skill_analysis[skill] = 'High Demand'
-            elif skill_lower in medium_demand:
+            elif skill_lower in self.MEDIUM_DEMAND_SKILLS:
                 skill_analysis[skill] = 'Medium Demand'
             else:
                 skill_analysis[skill] = 'Stable Demand'
@@ -383,21 +755,15 @@ class JobRecommender:
     
     def identify_growth_areas(self, skills):
         """Identify areas for skill growth"""
+        return self.growth_areas_for(self.normalize_skills(skills))
+    
+    def growth_areas_for(self, user_skills_lower):
+        """Identify growth areas for an already normalized skill set"""
         growth_suggestions = []
         
-        skill_categories = {
-            'frontend': ['html', 'css', 'javascript', 'react', 'vue', 'angular'],
-            'backend': ['python', 'java', 'node.js', 'sql', 'api'],
-            'cloud': ['aws', 'azure', 'gcp', 'docker', 'kubernetes'],
-            'data': ['python', 'r', 'machine learning', 'sql', 'pandas'],
-            'mobile': ['swift', 'kotlin', 'react native', 'flutter']
-        }
-        
-        user_skills_lower = [skill.lower() for skill in skills]
-        
         # Suggest complementary skills
-        for category, category_skills in skill_categories.items():
-            matches = sum(1 for skill in category_skills if skill in user_skills_lower)
+        for category, category_skills in self.SKILL_CATEGORIES.items():
+            matches = len(user_skills_lower & self.SKILL_CATEGORY_SETS[category])
             if matches >= 2:  # User has some skills in this category
                 missing_skills = [skill for skill in category_skills if skill not in user_skills_lower]
                 if missing_skills:
@@ -408,8 +774,7 @@ class JobRecommender:
                     })
         
         # Always suggest trending skills
-        trending_skills = ['machine learning', 'docker', 'kubernetes', 'typescript', 'graphql']
-        missing_trending = [skill for skill in trending_skills if skill not in user_skills_lower]
+        missing_trending = [skill for skill in self.TRENDING_SKILLS if skill not in user_skills_lower]
         
         if missing_trending:
             growth_suggestions.append({
@@ -422,13 +787,16 @@ class JobRecommender:
     
     def get_career_recommendations(self, skills, experience_level):
         """Get career path recommendations"""
+        return self.career_paths_for(self.normalize_skills(skills), experience_level)
+    
+    def career_paths_for(self, skill_lower, experience_level):
+        """Get career path recommendations for an already normalized skill set"""
         recommendations = []
         
-        skill_lower = [skill.lower() for skill in skills]
         exp_level = self.normalize_experience_level(experience_level)
         
         # Frontend path
-        if any(skill in skill_lower for skill in ['html', 'css', 'javascript', 'react', 'vue', 'angular']):
+        if not skill_lower.isdisjoint(self.FRONTEND_PATH_SKILLS):
             recommendations.append({
                 'path': 'Frontend Specialization',
                 'next_steps': ['Master TypeScript', 'Learn advanced React patterns', 'Study UI/UX principles'],
@@ -436,7 +804,7 @@ class JobRecommender:
             })
         
         # Backend path
-        if any(skill in skill_lower for skill in ['python', 'java', 'node.js', 'sql', 'api']):
+        if not skill_lower.isdisjoint(self.BACKEND_PATH_SKILLS):
             recommendations.append({
                 'path': 'Backend/API Development',
                 'next_steps': ['Learn microservices', 'Master cloud platforms', 'Study system design'],
@@ -444,7 +812,7 @@ class JobRecommender:
             })
         
         # Data path
-        if any(skill in skill_lower for skill in ['python', 'r', 'sql', 'machine learning', 'statistics']):
+        if not skill_lower.isdisjoint(self.DATA_PATH_SKILLS):
             recommendations.append({
                 'path': 'Data Science/ML Engineering',
                 'next_steps': ['Advanced ML algorithms', 'Big data tools', 'MLOps practices'],
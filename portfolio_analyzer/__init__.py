@@ -3,6 +3,15 @@ DevMatch AI - Portfolio Analyzer Module
 Comprehensive portfolio analysis for UI/UX and technical assessment
 """
 
+from functools import lru_cache
+
 from .portfolio_checker import PortfolioAnalyzer
 
-__all__ = ['PortfolioAnalyzer']
\ No newline at end of file
+
+@lru_cache(maxsize=1)
+def get_portfolio_analyzer():
+    """Return the shared portfolio analyzer instance, built on first use"""
+    return PortfolioAnalyzer()
+
+
+__all__ = ['PortfolioAnalyzer', 'get_portfolio_analyzer']
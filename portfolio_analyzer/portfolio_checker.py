@@ -6,14 +6,122 @@ Comprehensive portfolio analysis for UI/UX and technical assessment
 import os
 import re
 import json
+import hashlib
 import zipfile
 import tarfile
 import rarfile
 from datetime import datetime
 from collections import Counter, defaultdict
 import mimetypes
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+from common.cache import cached_by_hash
+
+ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.gz', '.rar')
+DIGEST_CHUNK_BYTES = 1024 * 1024
+
+
+def portfolio_digest(filepath):
+    """Hash an uploaded portfolio in chunks, together with the part of its name that affects the analysis"""
+    # Archives are read by extension alone; a single file is also analyzed under its own name
+    file_ext = os.path.splitext(filepath)[1].lower()
+    name = file_ext if file_ext in ARCHIVE_EXTENSIONS else os.path.basename(filepath)
+    digest = hashlib.blake2b(name.encode('utf-8', 'surrogatepass') + b'\0', digest_size=16)
+    with open(filepath, 'rb') as file:
+        for chunk in iter(lambda: file.read(DIGEST_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def analysis_environment(analyzer):
+    """Optional backends installed when a cached portfolio analysis ran"""
+    return (AHOCORASICK_AVAILABLE, ORJSON_AVAILABLE, RE2_AVAILABLE)
+
+# Non-ASCII characters that re.IGNORECASE matches to ASCII letters but str.lower() leaves alone
+IGNORECASE_FOLD_CHARS = '\u0130\u0131\u017f'
+IGNORECASE_FOLDS = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's'})
+
+
+def needs_folding(text):
+    """Return True if text contains a character that str.lower() alone would not fold"""
+    return not text.isascii() and any(char in text for char in IGNORECASE_FOLD_CHARS)
+
+
+def fold_case(text):
+    """Lowercase text so an ASCII literal occurs in it wherever re.IGNORECASE would match it"""
+    # translate() walks non-ASCII text in Python-level steps, so it only runs when there is something to fold
+    if needs_folding(text):
+        text = text.translate(IGNORECASE_FOLDS)
+    return text.lower()
+
+
+# Python's \w and \s restricted to ASCII text, spelled out for RE2 whose own classes differ (no \v or \x1c-\x1f)
+ASCII_WORD = '[0-9A-Za-z_]'
+ASCII_SPACE = '[\\t\\n\\x0b\\x0c\\r\\x1c-\\x1f ]'
+
+# Patterns made only of plain or escaped characters match exactly their literal text
+LITERAL_PATTERN = re.compile(r'(?:[^.^$*+?{}\[\]()|\\]|\\[^0-9A-Za-z])*')
+
+
+def literal_prefix(pattern):
+    """Return the lowercase literal text every match of a regex pattern starts with ('' if none)"""
+    prefix = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\' and index + 1 < len(pattern) and not pattern[index + 1].isalnum():
+            literal, index = pattern[index + 1], index + 2
+        elif char not in '.^$*+?{}[]()|\\':
+            literal, index = char, index + 1
+        else:
+            break
+        # A quantified character may be absent or repeated, so the prefix ends before it
+        if index < len(pattern) and pattern[index] in '*+?{':
+            break
+        prefix.append(literal)
+    return ''.join(prefix).lower()
+
+
+@lru_cache(maxsize=None)
+def worker_analyzer(analyzer_class):
+    """Return the analyzer a pool worker process uses for its files, built on first use"""
+    return analyzer_class()
+
+
+def analyze_file_in_worker(analyzer_class, file_info):
+    """Analyze one portfolio file inside a pool worker process"""
+    return worker_analyzer(analyzer_class).analyze_file(file_info)
+
 
 class PortfolioAnalyzer:
+    # Per-file analysis moves to a process pool only when there is enough text to repay starting it
+    PARALLEL_MIN_FILES = 8
+    PARALLEL_MIN_BYTES = 1024 * 1024
+    
+    # Dependency and build output directories left out of the scan, along with hidden ones
+    SKIPPED_DIRS = frozenset(['node_modules', 'dist', 'build', '__pycache__'])
+    
+    # Text analysis reads at most this much of a file; generated bundles and binary files are not analyzed
+    MAX_TEXT_BYTES = 512 * 1024
+    BINARY_SNIFF_BYTES = 1024
+    GENERATED_FILE_NAMES = frozenset(['package-lock.json', 'yarn.lock'])
+    GENERATED_FILE_SUFFIXES = ('.min.js', '.min.css', '.map')
+    
     def __init__(self):
         self.setup_analyzers()
         self.load_best_practices()
@@ -34,6 +142,47 @@ class PortfolioAnalyzer:
         self.image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.ico'}
         self.font_extensions = {'.woff', '.woff2', '.ttf', '.otf', '.eot'}
         self.video_extensions = {'.mp4', '.webm', '.avi', '.mov'}
+        
+        # HTML markers, compiled once and reused for every document
+        self.html_patterns = {
+            'links': re.compile(r'<a\s+[^>]*href', re.IGNORECASE),
+            'css_links': re.compile(r'<link[^>]*href=["\']([^"\']*\.css)["\']', re.IGNORECASE),
+            'js_scripts': re.compile(r'<script[^>]*src=["\']([^"\']*\.js)["\']', re.IGNORECASE)
+        }
+        self.css_patterns = {
+            # Any number before a unit means its last digit is directly before it, and one digit never backtracks
+            'responsive_units': re.compile(r'\d(?:rem|em|%|vw|vh)'),
+            'colors': re.compile(r'#[0-9a-fA-F]{3,6}'),
+            'font_families': re.compile(r'font-family:\s*([^;]+)', re.IGNORECASE),
+            'font_families_lower': re.compile(r'font-family:\s*([^;]+)')
+        }
+        self.js_patterns = {
+            'destructuring': re.compile(r'(?:const|let|var)\s*{[^}]+}\s*='),
+            'functions': re.compile(r'function\s+\w+|=>\s*{|\w+\s*:\s*function')
+        }
+        self.ts_patterns = {
+            'types': re.compile(r'type\s+\w+\s*='),
+            'generics': re.compile(r'<[A-Z]\w*>'),
+            'type_annotations': re.compile(r':\s*(?:string|number|boolean|object)')
+        }
+        # RE2 runs in linear time, so when installed it takes the patterns that backtrack badly on long
+        # minified lines; its classes are ASCII-only, so these are used for ASCII content only
+        if RE2_AVAILABLE:
+            self.linear_patterns = {
+                'destructuring': re2.compile(f'(?:const|let|var){ASCII_SPACE}*{{[^}}]+}}{ASCII_SPACE}*='),
+                'functions': re2.compile(
+                    f'function{ASCII_SPACE}+{ASCII_WORD}+|=>{ASCII_SPACE}*{{|{ASCII_WORD}+{ASCII_SPACE}*:{ASCII_SPACE}*function'
+                ),
+                'type_annotations': re2.compile(f':{ASCII_SPACE}*(?:string|number|boolean|object)')
+            }
+        else:
+            self.linear_patterns = None
+        self.markdown_patterns = {
+            'headers': re.compile(r'^#+\s', re.MULTILINE)
+        }
+        self.semantic_tags = ['header', 'nav', 'main', 'section', 'article', 'aside', 'footer']
+        self.semantic_tag_openers = [(tag, f'<{tag}') for tag in self.semantic_tags]
+        self.accessibility_markers = ['alt=', 'aria-', 'role=', 'tabindex', 'label']
     
     def load_best_practices(self):
         """Load UI/UX and technical best practices"""
@@ -60,7 +209,7 @@ class PortfolioAnalyzer:
         self.tech_patterns = {
             'React': [r'import.*react', r'from [\'"]react[\'"]', r'React\.', r'jsx', r'useState', r'useEffect'],
             'Vue.js': [r'import.*vue', r'from [\'"]vue[\'"]', r'Vue\.', r'v-if', r'v-for', r'@click'],
-            'Angular': [r'import.*@angular', r'@Component', r'@Injectable', r'ngOnInit', r'*ngFor', r'*ngIf'],
+            'Angular': [r'import.*@angular', r'@Component', r'@Injectable', r'ngOnInit', r'\*ngFor', r'\*ngIf'],
             'jQuery': [r'\$\(', r'jQuery', r'\.jquery'],
             'Bootstrap': [r'bootstrap', r'btn-', r'col-', r'row', r'container'],
             'Tailwind CSS': [r'tailwind', r'bg-', r'text-', r'p-\d', r'm-\d', r'w-\d'],
@@ -73,64 +222,117 @@ class PortfolioAnalyzer:
             'ESLint': [r'eslint', r'\.eslintrc', r'eslint-disable'],
             'Prettier': [r'prettier', r'\.prettierrc', r'prettier-ignore']
         }
+        self.tech_patterns_compiled = {
+            tech: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for tech, patterns in self.tech_patterns.items()
+        }
+        
+        # A pattern can only match where its literal prefix occurs, so one Aho-Corasick pass over the
+        # case-folded content tells which patterns are worth searching for
+        self.tech_literals = {
+            tech: [literal_prefix(pattern) for pattern in patterns]
+            for tech, patterns in self.tech_patterns.items()
+        }
+        self.tech_literal_set = {literal for literals in self.tech_literals.values() for literal in literals if literal}
+        
+        # Per technology: literals that prove it on their own, and (prefix, regex) pairs that need a search
+        self.tech_checks = {}
+        confirmed_by = defaultdict(set)
+        searched_after = defaultdict(list)
+        for tech, patterns in self.tech_patterns.items():
+            exact_literals, regex_checks = set(), []
+            for pattern, literal, compiled in zip(patterns, self.tech_literals[tech], self.tech_patterns_compiled[tech]):
+                if literal and LITERAL_PATTERN.fullmatch(pattern):
+                    exact_literals.add(literal)
+                    confirmed_by[literal].add(tech)
+                else:
+                    regex_checks.append((literal, compiled))
+                    searched_after[literal].append((tech, compiled))
+            self.tech_checks[tech] = (frozenset(exact_literals), regex_checks)
+        self.unprefixed_tech_checks = searched_after.pop('', [])
+        
+        if AHOCORASICK_AVAILABLE:
+            self.tech_automaton = ahocorasick.Automaton()
+            for literal in self.tech_literal_set:
+                self.tech_automaton.add_word(literal, (literal, frozenset(confirmed_by.get(literal, ())), searched_after.get(literal, [])))
+            self.tech_automaton.make_automaton()
+        else:
+            self.tech_automaton = None
     
     def analyze_portfolio(self, filepath):
         """Main portfolio analysis function"""
+        results = self.run_portfolio_analysis(filepath)
+        if not results.get('error'):
+            results['analysis_date'] = datetime.now().isoformat()
+        return results
+    
+    @cached_by_hash('portfolio', payload_bytes=portfolio_digest, environment=analysis_environment)
+    def run_portfolio_analysis(self, filepath):
+        """Analyze a portfolio upload; the result depends on its contents and the name portfolio_digest hashes"""
         try:
-            # Extract portfolio files
-            extracted_path = self.extract_portfolio(filepath)
+            # Read portfolio files straight out of the archive
+            file_inventory = self.read_portfolio(filepath)
             
-            if not extracted_path:
+            if file_inventory is None:
                 return self.get_error_result("Could not extract portfolio files")
             
             # Analyze portfolio structure and content
-            analysis_results = self.perform_comprehensive_analysis(extracted_path)
-            
-            # Cleanup extracted files
-            self.cleanup_extracted_files(extracted_path)
-            
-            return analysis_results
+            return self.perform_comprehensive_analysis(file_inventory)
             
         except Exception as e:
             return self.get_error_result(f"Portfolio analysis failed: {str(e)}")
     
-    def extract_portfolio(self, filepath):
-        """Extract portfolio archive to temporary directory"""
-        import tempfile
-        import shutil
-        
-        file_ext = os.path.splitext(filepath)[1].lower()
-        temp_dir = tempfile.mkdtemp(prefix='devmatch_portfolio_')
-        
+    def read_portfolio(self, filepath):
+        """Scan a portfolio archive in memory, returning its file inventory or None if it can't be read"""
         try:
-            if file_ext == '.zip':
-                with zipfile.ZipFile(filepath, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
-            elif file_ext in ['.tar', '.gz']:
-                with tarfile.open(filepath, 'r:*') as tar_ref:
-                    tar_ref.extractall(temp_dir)
-            elif file_ext == '.rar':
-                with rarfile.RarFile(filepath, 'r') as rar_ref:
-                    rar_ref.extractall(temp_dir)
-            else:
-                # Single file - copy to temp directory
-                shutil.copy2(filepath, temp_dir)
-            
-            return temp_dir
-            
+            return self.scan_files(self.iter_portfolio_entries(filepath))
         except Exception as e:
             print(f"Extraction error: {e}")
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
             return None
     
-    def perform_comprehensive_analysis(self, portfolio_path):
-        """Perform comprehensive portfolio analysis"""
-        # Scan all files
-        file_inventory = self.scan_files(portfolio_path)
+    def iter_portfolio_entries(self, filepath):
+        """Yield (archive path, size, reader) for each file; reader(limit) returns up to limit leading bytes"""
+        file_ext = os.path.splitext(filepath)[1].lower()
         
+        # Readers are only valid while the archive is open, so consumers call them before advancing
+        if file_ext == '.zip':
+            with zipfile.ZipFile(filepath, 'r') as zip_ref:
+                for info in zip_ref.infolist():
+                    if not info.is_dir():
+                        yield info.filename, info.file_size, lambda limit, info=info: self.read_head(zip_ref.open(info), limit)
+        elif file_ext in ['.tar', '.gz']:
+            # Random-access mode still reads headers lazily; stream mode ('r|*') was several times slower
+            # and treats a truncated compressed archive as complete instead of raising
+            with tarfile.open(filepath, 'r:*') as tar_ref:
+                # Iterating the archive hands over each TarInfo, so extractfile never searches members by name
+                for member in tar_ref:
+                    if member.isfile():
+                        yield member.name, member.size, lambda limit, member=member: self.read_head(tar_ref.extractfile(member), limit)
+        elif file_ext == '.rar':
+            with rarfile.RarFile(filepath, 'r') as rar_ref:
+                for info in rar_ref.infolist():
+                    if not info.is_dir():
+                        yield info.filename, info.file_size, lambda limit, info=info: self.read_head(rar_ref.open(info), limit)
+        else:
+            # Single file
+            with open(filepath, 'rb') as f:
+                # The size comes from the open handle rather than a second stat() by path
+                yield os.path.basename(filepath), os.fstat(f.fileno()).st_size, f.read
+    
+    def read_head(self, member_file, limit):
+        """Read up to limit bytes from an archive member and close it"""
+        with member_file:
+            return member_file.read(limit)
+    
+    def is_generated_file(self, name):
+        """Return True for lockfiles, minified bundles and source maps, which carry no hand-written code"""
+        name = name.lower()
+        return name in self.GENERATED_FILE_NAMES or name.endswith(self.GENERATED_FILE_SUFFIXES)
+    
+    def perform_comprehensive_analysis(self, file_inventory):
+        """Perform comprehensive portfolio analysis"""
         # Analyze file contents
-        content_analysis = self.analyze_file_contents(portfolio_path, file_inventory)
+        content_analysis = self.analyze_file_contents(file_inventory)
         
         # Detect technologies
         technologies = self.detect_technologies(content_analysis['all_content'])
@@ -158,7 +360,7 @@ class PortfolioAnalyzer:
         )
         
         return {
-            'analysis_date': datetime.now().isoformat(),
+            'analysis_date': None,
             'file_count': len(file_inventory['all_files']),
             'total_size': file_inventory['total_size'],
             'technologies_detected': technologies,
@@ -175,83 +377,119 @@ class PortfolioAnalyzer:
             'file_breakdown': file_inventory['file_types']
         }
     
-    def scan_files(self, portfolio_path):
-        """Scan and categorize all files in portfolio"""
-        all_files = []
-        file_types = defaultdict(int)
-        total_size = 0
-        
-        for root, dirs, files in os.walk(portfolio_path):
+    def scan_files(self, entries):
+        """Scan and categorize all files in portfolio, reading the text of analyzable ones into memory"""
+        files_by_path = {}
+        
+        for archive_path, file_size, read in entries:
+            # Normalize archive paths the way extraction would, dropping '.', '..' and leading '/'
+            parts = [part for part in archive_path.replace('\\', '/').split('/') if part not in ('', '.', '..')]
+            if not parts:
+                continue
+            
             # Skip hidden directories and common build/dependency directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', 'dist', 'build', '__pycache__']]
+            folders, file = parts[:-1], parts[-1]
+            if any(d.startswith('.') or d in self.SKIPPED_DIRS for d in folders):
+                continue
+            if file.startswith('.'):
+                continue
+            
+            relative_path = os.path.join(*parts)
+            file_ext = os.path.splitext(file)[1].lower()
+            file_info = {
+                'path': relative_path,
+                'name': file,
+                'extension': file_ext,
+                'size': file_size,
+                'relative_path': relative_path
+            }
+            if file_ext in self.file_analyzers and not self.is_generated_file(file):
+                data = read(self.MAX_TEXT_BYTES)
+                # NUL bytes never occur in text files, so their presence marks binary data
+                if b'\0' not in data[:self.BINARY_SNIFF_BYTES]:
+                    # Decode like a text-mode open() would, including its newline translation
+                    text = data.decode('utf-8', errors='ignore')
+                    file_info['content'] = text.replace('\r\n', '\n').replace('\r', '\n')
             
-            for file in files:
-                if file.startswith('.'):
-                    continue
-                
-                filepath = os.path.join(root, file)
-                file_ext = os.path.splitext(file)[1].lower()
-                file_size = os.path.getsize(filepath)
-                
-                all_files.append({
-                    'path': filepath,
-                    'name': file,
-                    'extension': file_ext,
-                    'size': file_size,
-                    'relative_path': os.path.relpath(filepath, portfolio_path)
-                })
-                
-                file_types[file_ext] += 1
-                total_size += file_size
+            # A later entry for the same path replaces the earlier one, as extracting over it would
+            files_by_path[relative_path] = file_info
+        
+        all_files = list(files_by_path.values())
+        file_types = Counter(file_info['extension'] for file_info in all_files)
         
         return {
             'all_files': all_files,
             'file_types': dict(file_types),
-            'total_size': total_size
+            'total_size': sum(file_info['size'] for file_info in all_files)
         }
     
-    def analyze_file_contents(self, portfolio_path, file_inventory):
+    def analyze_file_contents(self, file_inventory):
         """Analyze content of relevant files"""
         content_analysis = {
-            'html_content': [],
-            'css_content': [],
-            'js_content': [],
+            'html_analyses': [],
+            'css_analyses': [],
+            'js_analyses': [],
             'all_content': '',
             'file_analyses': {}
         }
+        # Joined once at the end; growing one string per file copies the whole accumulator each time
+        content_parts = []
         
-        for file_info in file_inventory['all_files']:
+        analyzable_files = [file_info for file_info in file_inventory['all_files'] if 'content' in file_info]
+        file_analyses = self.run_file_analyzers(analyzable_files)
+        
+        for file_info, file_analysis in zip(analyzable_files, file_analyses):
             file_ext = file_info['extension']
-            filepath = file_info['path']
             
-            if file_ext in self.file_analyzers:
-                try:
-                    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        
-                    # Store content by type
-                    if file_ext == '.html':
-                        content_analysis['html_content'].append(content)
-                    elif file_ext == '.css':
-                        content_analysis['css_content'].append(content)
-                    elif file_ext in ['.js', '.ts']:
-                        content_analysis['js_content'].append(content)
-                    
-                    # Add to all content for technology detection
-                    content_analysis['all_content'] += content + '\n'
-                    
-                    # Analyze individual file
-                    analyzer = self.file_analyzers[file_ext]
-                    file_analysis = analyzer(content, filepath)
-                    content_analysis['file_analyses'][file_info['relative_path']] = file_analysis
-                    
-                except Exception as e:
-                    print(f"Error analyzing {filepath}: {e}")
-        
+            # Add to all content for technology detection; the inventory's copy is dropped since
+            # nothing after this pass reads per-file text, so the portfolio is held in memory once
+            content_parts.append(file_info.pop('content'))
+            content_parts.append('\n')
+            if file_analysis is None:
+                continue
+            
+            content_analysis['file_analyses'][file_info['relative_path']] = file_analysis
+            
+            # Store analyses by type for the UI/UX and technical passes
+            if file_ext == '.html':
+                content_analysis['html_analyses'].append(file_analysis)
+            elif file_ext == '.css':
+                content_analysis['css_analyses'].append(file_analysis)
+            elif file_ext in ['.js', '.ts']:
+                content_analysis['js_analyses'].append(file_analysis)
+        
+        content_analysis['all_content'] = ''.join(content_parts)
         return content_analysis
     
+    def run_file_analyzers(self, files):
+        """Analyze each file, in order, spreading large portfolios over a process pool"""
+        total_size = sum(len(file_info['content']) for file_info in files)
+        workers = min(len(files), os.cpu_count() or 1)
+        if workers > 1 and len(files) >= self.PARALLEL_MIN_FILES and total_size >= self.PARALLEL_MIN_BYTES:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    classes = [type(self)] * len(files)
+                    return list(pool.map(analyze_file_in_worker, classes, files, chunksize=max(1, len(files) // (workers * 4))))
+            except Exception as e:
+                print(f"Parallel file analysis unavailable, analyzing serially: {e}")
+        
+        return [self.analyze_file(file_info) for file_info in files]
+    
+    def analyze_file(self, file_info):
+        """Run the analyzer for one file, returning None if it fails"""
+        try:
+            analyzer = self.file_analyzers[file_info['extension']]
+            return analyzer(file_info['content'], file_info['path'])
+        except Exception as e:
+            print(f"Error analyzing {file_info['path']}: {e}")
+            return None
+    
     def analyze_html_file(self, content, filepath):
         """Analyze HTML file"""
+        content_lower = content.lower()
+        # Case-insensitive patterns are only run when their literal text occurs in the folded content
+        folded = fold_case(content) if needs_folding(content) else content_lower
+        
         analysis = {
             'has_doctype': '<!DOCTYPE html>' in content,
             'has_meta_viewport': 'viewport' in content,
@@ -260,25 +498,19 @@ class PortfolioAnalyzer:
             'accessibility_features': [],
             'external_resources': [],
             'forms': '<form' in content,
-            'images': len(re.findall(r'<img', content, re.IGNORECASE)),
-            'links': len(re.findall(r'<a\s+[^>]*href', content, re.IGNORECASE))
+            'images': folded.count('<img'),
+            'links': sum(1 for _ in self.html_patterns['links'].finditer(content)) if 'href' in folded else 0
         }
         
         # Check for semantic HTML tags
-        semantic_tags = ['header', 'nav', 'main', 'section', 'article', 'aside', 'footer']
-        for tag in semantic_tags:
-            if f'<{tag}' in content.lower():
-                analysis['semantic_tags'].append(tag)
+        analysis['semantic_tags'] = [tag for tag, opener in self.semantic_tag_openers if opener in content_lower]
         
         # Check accessibility features
-        accessibility_features = ['alt=', 'aria-', 'role=', 'tabindex', 'label']
-        for feature in accessibility_features:
-            if feature in content.lower():
-                analysis['accessibility_features'].append(feature)
+        analysis['accessibility_features'] = [feature for feature in self.accessibility_markers if feature in content_lower]
         
         # Check for external resources
-        css_links = re.findall(r'<link[^>]*href=["\']([^"\']*\.css)["\']', content, re.IGNORECASE)
-        js_scripts = re.findall(r'<script[^>]*src=["\']([^"\']*\.js)["\']', content, re.IGNORECASE)
+        css_links = self.html_patterns['css_links'].findall(content) if '<link' in folded else []
+        js_scripts = self.html_patterns['js_scripts'].findall(content) if '<script' in folded else []
         analysis['external_resources'] = css_links + js_scripts
         
         return analysis
@@ -293,22 +525,33 @@ class PortfolioAnalyzer:
             'uses_animations': '@keyframes' in content or 'animation:' in content,
             'uses_transforms': 'transform:' in content,
             'uses_transitions': 'transition:' in content,
-            'responsive_units': bool(re.search(r'\d+(?:rem|em|%|vw|vh)', content)),
-            'color_count': len(set(re.findall(r'#[0-9a-fA-F]{3,6}', content))),
-            'font_families': len(set(re.findall(r'font-family:\s*([^;]+)', content, re.IGNORECASE)))
+            'responsive_units': bool(self.css_patterns['responsive_units'].search(content)),
+            'color_count': len(set(self.css_patterns['colors'].findall(content))) if '#' in content else 0,
+            'font_families': len(set(self.find_font_families(content)))
         }
         
         return analysis
     
+    def find_font_families(self, content):
+        """Return the font-family values declared in CSS content"""
+        if needs_folding(content):
+            return self.css_patterns['font_families'].findall(content)
+        
+        # Without characters to fold, lowercasing keeps every offset, so a case-sensitive scan of the
+        # lowered text finds the same spans as the case-insensitive one and they index the original
+        matches = self.css_patterns['font_families_lower'].finditer(content.lower())
+        return [content[match.start(1):match.end(1)] for match in matches]
+    
     def analyze_js_file(self, content, filepath):
         """Analyze JavaScript file"""
+        patterns = self.linear_patterns if self.linear_patterns and content.isascii() else self.js_patterns
         analysis = {
             'uses_es6': any(pattern in content for pattern in ['=>', 'const ', 'let ', '`', '...', 'class ']),
             'uses_async_await': 'async ' in content and 'await ' in content,
             'uses_promises': '.then(' in content or 'Promise' in content,
             'uses_modules': 'import ' in content or 'export ' in content,
-            'uses_destructuring': bool(re.search(r'(?:const|let|var)\s*{[^}]+}\s*=', content)),
-            'function_count': len(re.findall(r'function\s+\w+|=>\s*{|\w+\s*:\s*function', content)),
+            'uses_destructuring': '{' in content and bool(patterns['destructuring'].search(content)),
+            'function_count': len(patterns['functions'].findall(content)) if 'function' in content or '=>' in content else 0,
             'has_comments': '//' in content or '/*' in content,
             'uses_strict_mode': "'use strict'" in content or '"use strict"' in content,
             'dom_manipulation': any(method in content for method in ['getElementById', 'querySelector', 'addEventListener']),
@@ -320,12 +563,13 @@ class PortfolioAnalyzer:
     def analyze_ts_file(self, content, filepath):
         """Analyze TypeScript file"""
         js_analysis = self.analyze_js_file(content, filepath)
+        patterns = self.linear_patterns if self.linear_patterns and content.isascii() else self.ts_patterns
         
         ts_specific = {
             'has_interfaces': 'interface ' in content,
-            'has_types': bool(re.search(r'type\s+\w+\s*=', content)),
-            'uses_generics': bool(re.search(r'<[A-Z]\w*>', content)),
-            'has_type_annotations': bool(re.search(r':\s*(?:string|number|boolean|object)', content)),
+            'has_types': 'type' in content and bool(self.ts_patterns['types'].search(content)),
+            'uses_generics': '<' in content and bool(self.ts_patterns['generics'].search(content)),
+            'has_type_annotations': ':' in content and bool(patterns['type_annotations'].search(content)),
             'uses_enums': 'enum ' in content
         }
         
@@ -334,7 +578,7 @@ class PortfolioAnalyzer:
     def analyze_json_file(self, content, filepath):
         """Analyze JSON file"""
         try:
-            data = json.loads(content)
+            data = self.load_json(content)
             return {
                 'valid_json': True,
                 'is_package_json': 'package.json' in filepath,
@@ -344,11 +588,21 @@ class PortfolioAnalyzer:
         except json.JSONDecodeError:
             return {'valid_json': False}
     
+    def load_json(self, content):
+        """Parse JSON text, using orjson when installed and json for anything orjson rejects"""
+        # json accepts a few things orjson refuses (NaN, escaped lone surrogates, huge integers), so it has the final say
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(content)
+    
     def analyze_markdown_file(self, content, filepath):
         """Analyze Markdown file"""
         return {
             'is_readme': 'readme' in filepath.lower(),
-            'has_headers': bool(re.search(r'^#+\s', content, re.MULTILINE)),
+            'has_headers': '#' in content and bool(self.markdown_patterns['headers'].search(content)),
             'has_links': '[' in content and '](' in content,
             'has_images': '![' in content,
             'has_code_blocks': '```' in content,
@@ -365,25 +619,57 @@ class PortfolioAnalyzer:
     
     def detect_technologies(self, content):
         """Detect technologies used in the portfolio"""
+        if self.tech_automaton is not None:
+            return self.scan_technologies(content)
+        
         detected_technologies = []
+        present_literals = self.find_tech_literals(content)
         
-        for tech, patterns in self.tech_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    detected_technologies.append(tech)
-                    break
+        for tech, (exact_literals, regex_checks) in self.tech_checks.items():
+            if not exact_literals.isdisjoint(present_literals) or any(
+                literal in present_literals and pattern.search(content) for literal, pattern in regex_checks
+            ):
+                detected_technologies.append(tech)
         
         return list(set(detected_technologies))
     
+    def scan_technologies(self, content):
+        """Detect technologies in one Aho-Corasick pass, stopping once every technology is found"""
+        unconfirmed = set(self.tech_checks)
+        for tech, pattern in self.unprefixed_tech_checks:
+            if tech in unconfirmed and pattern.search(content):
+                unconfirmed.discard(tech)
+        
+        # A regex can only match once its prefix shows up, so each one is searched at its prefix's first hit
+        searched = set()
+        for _, (literal, confirms, regex_checks) in self.tech_automaton.iter(fold_case(content)):
+            if not unconfirmed:
+                break
+            unconfirmed.difference_update(confirms)
+            if regex_checks and literal not in searched:
+                searched.add(literal)
+                for tech, pattern in regex_checks:
+                    if tech in unconfirmed and pattern.search(content):
+                        unconfirmed.discard(tech)
+        
+        return [tech for tech in self.tech_checks if tech not in unconfirmed]
+    
+    def find_tech_literals(self, content):
+        """Return the technology pattern prefixes present in content ('' is always present)"""
+        # Substring probes are far cheaper than case-insensitive regex scans that find nothing
+        folded = fold_case(content)
+        return {''} | {literal for literal in self.tech_literal_set if literal in folded}
+    
     def analyze_project_structure(self, file_inventory):
         """Analyze project structure and organization"""
         structure = {
             'has_readme': False,
             'has_package_json': False,
             'has_gitignore': False,
-            'folder_structure': defaultdict(int),
+            'folder_structure': None,
             'organization_score': 0
         }
+        folders = []
         
         for file_info in file_inventory['all_files']:
             filename = file_info['name'].lower()
@@ -400,15 +686,18 @@ class PortfolioAnalyzer:
             # Analyze folder structure
             folder = os.path.dirname(relative_path)
             if folder:
-                structure['folder_structure'][folder] += 1
+                folders.append(folder)
+        
+        structure['folder_structure'] = Counter(folders)
         
-        # Calculate organization score
+        # Calculate organization score; folder names are joined once so each substring check is a single scan
+        folder_names = '\0'.join(structure['folder_structure'])
         organization_factors = [
             structure['has_readme'],
             structure['has_package_json'],
             len(structure['folder_structure']) > 1,  # Multiple folders
-            any('src' in folder or 'assets' in folder for folder in structure['folder_structure']),
-            any('css' in folder or 'styles' in folder for folder in structure['folder_structure'])
+            'src' in folder_names or 'assets' in folder_names,
+            'css' in folder_names or 'styles' in folder_names
         ]
         
         structure['organization_score'] = sum(organization_factors) * 20
@@ -427,9 +716,7 @@ class PortfolioAnalyzer:
         }
         
         # Analyze HTML content
-        for html_content in content_analysis['html_content']:
-            html_analysis = self.analyze_html_file(html_content, '')
-            
+        for html_analysis in content_analysis['html_analyses']:
             # Semantic HTML
             ui_analysis['semantic_html_score'] += len(html_analysis['semantic_tags']) * 10
             
@@ -438,9 +725,7 @@ class PortfolioAnalyzer:
         
         # Analyze CSS content
         modern_css_features = 0
-        for css_content in content_analysis['css_content']:
-            css_analysis = self.analyze_css_file(css_content, '')
-            
+        for css_analysis in content_analysis['css_analyses']:
             # Responsive design
             if css_analysis['has_media_queries']:
                 ui_analysis['responsive_design'] = True
@@ -486,8 +771,7 @@ class PortfolioAnalyzer:
         js_quality_factors = 0
         js_file_count = 0
         
-        for js_content in content_analysis['js_content']:
-            js_analysis = self.analyze_js_file(js_content, '')
+        for js_analysis in content_analysis['js_analyses']:
             js_file_count += 1
             
             quality_factors = [
@@ -639,15 +923,6 @@ class PortfolioAnalyzer:
         
         return suggestions[:8]  # Limit to top 8 suggestions
     
-    def cleanup_extracted_files(self, extracted_path):
-        """Clean up extracted files"""
-        import shutil
-        try:
-            if os.path.exists(extracted_path):
-                shutil.rmtree(extracted_path)
-        except Exception as e:
-            print(f"Cleanup error: {e}")
-    
     def get_error_result(self, error_message):
         """Return error result structure"""
         return {
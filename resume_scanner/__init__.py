@@ -3,6 +3,22 @@ DevMatch AI - Resume Scanner Module
 Advanced NLP-powered resume analysis with ML recommendations
 """
 
-from .resume_analyzer import ResumeAnalyzer
+from functools import lru_cache
 
-__all__ = ['ResumeAnalyzer']
\ No newline at end of file
+
+def __getattr__(name):
+    """Import the analyzer module (and NLTK with it) only when it is first needed"""
+    if name == 'ResumeAnalyzer':
+        from .resume_analyzer import ResumeAnalyzer
+        return ResumeAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def get_resume_analyzer():
+    """Return the shared resume analyzer instance, built on first use"""
+    from .resume_analyzer import ResumeAnalyzer
+    return ResumeAnalyzer()
+
+
+__all__ = ['ResumeAnalyzer', 'get_resume_analyzer']
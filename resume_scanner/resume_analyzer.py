@@ -6,61 +6,227 @@ Advanced NLP-powered resume analysis with ML recommendations
 import os
 import re
 import json
-import PyPDF2
-import docx
-from collections import Counter
+import copy
+import hashlib
+import threading
+import importlib.util
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter, OrderedDict
 from datetime import datetime
-import nltk
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
+# NLTK, the PDF reader and python-docx are imported on first use (see load_nltk_resources, load_pdf_reader
+# and extract_docx_text), so importing this module stays cheap
+# spaCy is only located here; the package and its model are imported on first use in load_spacy_model
+SPACY_AVAILABLE = importlib.util.find_spec('spacy') is not None
+if not SPACY_AVAILABLE:
+    print("spaCy not available - using basic NLP features")
 try:
-    import spacy
-    SPACY_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    SPACY_AVAILABLE = False
-    print("spaCy not available - using basic NLP features")
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
+    AHOCORASICK_AVAILABLE = False
+from common.cache import cached_by_hash
+
+DIGEST_CHUNK_BYTES = 1024 * 1024
+NLTK_RESOURCES = {'stopwords': 'corpora/stopwords/', 'wordnet': 'corpora/wordnet/'}
+
+
+def resume_digest(filepath):
+    """Hash a resume file in chunks, together with the extension that picks its text extractor"""
+    file_ext = os.path.splitext(filepath)[1].lower()
+    digest = hashlib.blake2b(file_ext.encode('utf-8', 'surrogatepass') + b'\0', digest_size=16)
+    with open(filepath, 'rb') as file:
+        for chunk in iter(lambda: file.read(DIGEST_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def extraction_environment(analyzer):
+    """Runtime state behind cached text extraction: pypdf and PyPDF2 extract PDF text differently"""
+    return importlib.util.find_spec('pypdf') is not None
+
+
+def analysis_environment(analyzer):
+    """Runtime state behind cached content analysis: experience is counted up to the current year"""
+    return (datetime.now().year, AHOCORASICK_AVAILABLE)
+
+# Patterns run on every resume, compiled once at import
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+PHONE_DIGITS_PATTERN = re.compile(r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}')
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/[\w-]+')
+GITHUB_PATTERN = re.compile(r'github\.com/[\w-]+')
+YEAR_PATTERN = re.compile(r'\b(19|20)\d{2}\b')
+NUMBER_PATTERN = re.compile(r'\d+')
+SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s\.\-\+\#\@]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+WORD_PATTERN = re.compile(r'\w+')
+# Sentence ends and word/punctuation tokens, approximating NLTK's Punkt and Treebank tokenizers
+SENTENCE_END_PATTERN = re.compile(r'[.!?]+(?=\s|$)')
+TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]')
+DEGREE_PATTERNS = [
+    re.compile(r'\b(bachelor|ba|bs|b\.a\.|b\.s\.)\b'),
+    re.compile(r'\b(master|ma|ms|m\.a\.|m\.s\.|mba)\b'),
+    re.compile(r'\b(phd|ph\.d\.|doctorate|doctoral)\b'),
+    re.compile(r'\b(associate|aa|as|a\.a\.|a\.s\.)\b')
+]
+
+
+@lru_cache(maxsize=1)
+def load_nltk_resources():
+    """Download the NLTK data once per process, returning (stop_words, lemmatizer)"""
+    try:
+        import nltk
+        from nltk.corpus import stopwords
+        from nltk.stem import WordNetLemmatizer
+        
+        # Try to download NLTK data, skipping packages already installed (nltk.download always hits the network)
+        print("Setting up NLTK data...")
+        cache_dir = os.environ.get('DEVMATCH_NLP_CACHE_DIR')
+        if cache_dir and cache_dir not in nltk.data.path:
+            nltk.data.path.insert(0, cache_dir)
+        for package, resource in NLTK_RESOURCES.items():
+            try:
+                nltk.data.find(resource)
+            except LookupError:
+                nltk.download(package, quiet=True, download_dir=cache_dir)
+        
+        stop_words = frozenset(stopwords.words('english'))
+        lemmatizer = WordNetLemmatizer()
+        print("NLTK setup completed successfully")
+    except Exception as e:
+        print(f"NLTK setup failed: {e}")
+        print("Using basic text processing without NLTK features")
+        # Fallback to basic stop words
+        stop_words = frozenset(['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'])
+        lemmatizer = None
+    return stop_words, lemmatizer
+
+
+@lru_cache(maxsize=1)
+def load_pdf_reader():
+    """Import the PDF reader class on first use"""
+    # pypdf is the maintained successor of PyPDF2 with the same reader API and a faster text extractor
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        from PyPDF2 import PdfReader
+    return PdfReader
+
+
+@lru_cache(maxsize=1)
+def load_spacy_model():
+    """Load the spaCy pipeline once per process, without the unused NER and parser components"""
+    if not SPACY_AVAILABLE:
+        return None
+    import spacy
+    try:
+        return spacy.load("en_core_web_sm", disable=['ner', 'parser'])
+    except OSError:
+        print("Warning: spaCy model not found. Using basic NLP features.")
+        return None
+
+
+@lru_cache(maxsize=None)
+def worker_analyzer(analyzer_class):
+    """Return the analyzer a pool worker process uses for its resumes, built on first use"""
+    return analyzer_class()
+
+
+def analyze_file_in_worker(analyzer_class, filepath):
+    """Analyze one resume file inside a pool worker process"""
+    return worker_analyzer(analyzer_class).analyze_file(filepath)
+
+
+def is_word_boundary(text, index):
+    """Return True where re's \\b would match at index in text"""
+    before = index > 0 and (text[index - 1].isalnum() or text[index - 1] == '_')
+    after = index < len(text) and (text[index].isalnum() or text[index] == '_')
+    return before != after
+
+
+class PhraseScanner:
+    """Find every phrase that occurs in a text as r'\\bphrase\\b', in one pass"""
+    
+    def __init__(self, phrases):
+        self.phrases = sorted(set(phrases), key=len, reverse=True)
+        
+        if AHOCORASICK_AVAILABLE:
+            self.automaton = ahocorasick.Automaton()
+            for phrase in self.phrases:
+                self.automaton.add_word(phrase, phrase)
+            self.automaton.make_automaton()
+        else:
+            self.automaton = None
+            # Longest-first lookahead finds the longest phrase at each position; shorter
+            # phrases matching at the same position are prefixes of it, so precompute them
+            alternation = '|'.join(re.escape(phrase) for phrase in self.phrases)
+            self.pattern = re.compile(r'(?=\b(' + alternation + r')\b)')
+            self.nested_phrases = {
+                phrase: [other for other in self.phrases
+                         if len(other) < len(phrase) and phrase.startswith(other) and is_word_boundary(phrase, len(other))]
+                for phrase in self.phrases
+            }
+    
+    def find(self, text):
+        """Return the set of phrases found in text"""
+        found = set()
+        
+        if self.automaton is not None:
+            for end, phrase in self.automaton.iter(text):
+                if is_word_boundary(text, end - len(phrase) + 1) and is_word_boundary(text, end + 1):
+                    found.add(phrase)
+            return found
+        
+        for match in self.pattern.finditer(text):
+            phrase = match.group(1)
+            found.add(phrase)
+            found.update(self.nested_phrases[phrase])
+        return found
+
 
 class ResumeAnalyzer:
+    # PDF extraction stops after this many pages or characters; resumes fit well within both,
+    # and long uploads (portfolios, theses) would otherwise be parsed page by page in full
+    MAX_PDF_PAGES = 5
+    MAX_PDF_CHARS = 20000
+    
+    # Batches smaller than this are analyzed serially; each pool worker sets up its own analyzer first
+    BATCH_PARALLEL_THRESHOLD = 8
+    
+    # Extracted text shorter than this is a failed extraction (e.g. a scanned PDF), not a resume worth analyzing
+    MIN_RESUME_WORDS = 20
+    
     def __init__(self):
         self.setup_nltk()
         self.setup_spacy()
         self.load_skill_database()
         self.load_job_keywords()
+        self.setup_analysis_cache()
         
+    def setup_analysis_cache(self, max_entries=256):
+        """Initialize the LRU cache of analyze_content results, keyed by content hash"""
+        self.analysis_cache = OrderedDict()
+        self.analysis_cache_size = max_entries
+        self.analysis_cache_lock = threading.Lock()
+    
     def setup_nltk(self):
-        """Download required NLTK data"""
-        try:
-            # Try to download NLTK data
-            print("Setting up NLTK data...")
-            nltk.download('punkt', quiet=True)
-            nltk.download('stopwords', quiet=True)
-            nltk.download('wordnet', quiet=True)
-            
-            self.stop_words = set(stopwords.words('english'))
-            self.lemmatizer = WordNetLemmatizer()
-            print("NLTK setup completed successfully")
-        except Exception as e:
-            print(f"NLTK setup failed: {e}")
-            print("Using basic text processing without NLTK features")
-            # Fallback to basic stop words
-            self.stop_words = set(['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'])
-            self.lemmatizer = None
+        """Set up NLTK resources, shared by every analyzer in the process"""
+        self.stop_words, self.lemmatizer = load_nltk_resources()
     
     def setup_spacy(self):
-        """Setup spaCy NLP pipeline"""
-        if SPACY_AVAILABLE:
-            try:
-                self.nlp = spacy.load("en_core_web_sm")
-            except OSError:
-                print("Warning: spaCy model not found. Using basic NLP features.")
-                self.nlp = None
-        else:
+        """Setup spaCy NLP pipeline (the model is loaded lazily by get_nlp)"""
+        self.nlp = None
+        self.nlp_loaded = False
+        if not SPACY_AVAILABLE:
             print("spaCy not available. Using basic NLP features.")
-            self.nlp = None
+    
+    def get_nlp(self):
+        """Return the spaCy pipeline, loading the shared model on first use"""
+        if not self.nlp_loaded:
+            self.nlp_loaded = True
+            self.nlp = load_spacy_model()
+        return self.nlp
     
     def load_skill_database(self):
         """Load comprehensive skill database"""
@@ -105,6 +271,36 @@ class ResumeAnalyzer:
         self.all_skills = []
         for category, skills in self.skills_db.items():
             self.all_skills.extend(skills)
+        
+        # Common spellings of programming languages
+        self.language_variations = {
+            'javascript': ['js', 'javascript', 'ecmascript'],
+            'typescript': ['ts', 'typescript'],
+            'python': ['python', 'python3', 'py'],
+            'c++': ['c++', 'cpp', 'cplusplus'],
+            'c#': ['c#', 'csharp', 'c sharp'],
+            'node.js': ['node', 'nodejs', 'node.js']
+        }
+        
+        # Canonical display names for matched phrases, and each language's set of spellings
+        self.skill_titles = {skill.lower(): skill.title() for skill in self.all_skills}
+        self.language_spellings = [
+            (main_lang.title(), frozenset(variation.lower() for variation in variations))
+            for main_lang, variations in self.language_variations.items()
+        ]
+        
+        # Trending skills reported as missing when a resume lacks them
+        self.trending_skills = (
+            'Machine Learning', 'Cloud Computing', 'DevOps', 'Microservices',
+            'API Development', 'Agile', 'Docker', 'Kubernetes', 'React',
+            'Python', 'JavaScript', 'Git', 'CI/CD', 'AWS'
+        )
+        
+        # Build one scanner for skills and language spellings alike, so a resume is scanned once per call
+        self.skill_scanner = PhraseScanner(
+            [skill.lower() for skill in self.all_skills] +
+            [variation.lower() for variations in self.language_variations.values() for variation in variations]
+        )
     
     def load_job_keywords(self):
         """Load job-specific keywords for different roles"""
@@ -134,6 +330,12 @@ class ResumeAnalyzer:
                 'mobile', 'app store', 'firebase', 'api integration'
             ]
         }
+        
+        # Action words reported in the keyword density
+        self.important_keywords = (
+            'experience', 'developed', 'managed', 'created', 'implemented',
+            'designed', 'built', 'led', 'improved', 'optimized'
+        )
     
     def analyze_file(self, filepath):
         """Main analysis function"""
@@ -144,12 +346,18 @@ class ResumeAnalyzer:
             if not text:
                 return self.get_error_result("Could not extract text from file")
             
+            word_count = len(text.split())
+            if word_count < self.MIN_RESUME_WORDS:
+                return self.get_error_result(
+                    f"Resume text too short - found {word_count} words, at least {self.MIN_RESUME_WORDS} are needed"
+                )
+            
             # Perform comprehensive analysis
             results = {
                 'filename': os.path.basename(filepath),
                 'analysis_date': datetime.now().isoformat(),
                 'text_length': len(text),
-                'word_count': len(text.split()),
+                'word_count': word_count,
                 **self.analyze_content(text)
             }
             
@@ -158,8 +366,23 @@ class ResumeAnalyzer:
         except Exception as e:
             return self.get_error_result(f"Analysis failed: {str(e)}")
     
+    def analyze_files(self, filepaths, max_workers=None):
+        """Analyze many resume files, in order, spreading large batches over a process pool"""
+        filepaths = list(filepaths)
+        workers = max_workers or min(len(filepaths), os.cpu_count() or 1)
+        if workers > 1 and len(filepaths) >= self.BATCH_PARALLEL_THRESHOLD:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    classes = [type(self)] * len(filepaths)
+                    return list(pool.map(analyze_file_in_worker, classes, filepaths))
+            except Exception as e:
+                print(f"Parallel resume analysis unavailable, analyzing serially: {e}")
+        
+        return [self.analyze_file(filepath) for filepath in filepaths]
+    
+    @cached_by_hash('resume-text', payload_bytes=resume_digest, environment=extraction_environment)
     def extract_text(self, filepath):
-        """Extract text from various file formats"""
+        """Extract text from various file formats, cached by file content so re-uploads skip parsing"""
         file_ext = os.path.splitext(filepath)[1].lower()
         
         try:
@@ -177,56 +400,94 @@ class ResumeAnalyzer:
     
     def extract_pdf_text(self, filepath):
         """Extract text from PDF file"""
-        text = ""
+        # Pieces are joined once at the end; the pages read before any error are kept
+        parts = []
         try:
             with open(filepath, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
+                pdf_reader = load_pdf_reader()(file)
+                extracted_chars = 0
+                for page_number, page in enumerate(pdf_reader.pages):
+                    if page_number >= self.MAX_PDF_PAGES or extracted_chars >= self.MAX_PDF_CHARS:
+                        break
+                    page_text = page.extract_text() + "\n"
+                    parts.append(page_text)
+                    extracted_chars += len(page_text)
         except Exception as e:
             print(f"PDF extraction error: {e}")
-        return text
+        return "".join(parts)
     
     def extract_docx_text(self, filepath):
         """Extract text from DOCX file"""
-        text = ""
+        parts = []
         try:
+            import docx
             doc = docx.Document(filepath)
             for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+                parts.append(paragraph.text + "\n")
         except Exception as e:
             print(f"DOCX extraction error: {e}")
-        return text
+        return "".join(parts)
     
     def extract_txt_text(self, filepath):
         """Extract text from TXT file"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                return file.read()
-        except UnicodeDecodeError:
-            with open(filepath, 'r', encoding='latin-1') as file:
-                return file.read()
+            with open(filepath, 'rb') as file:
+                data = file.read()
         except Exception as e:
             print(f"TXT extraction error: {e}")
             return ""
+        
+        # Decode the bytes already in memory instead of reopening the file when they are not UTF-8
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError:
+            text = data.decode('latin-1')
+        # Match the newline translation that text-mode reads used to apply
+        return text.replace('\r\n', '\n').replace('\r', '\n')
     
     def analyze_content(self, text):
-        """Comprehensive content analysis"""
+        """Comprehensive content analysis, memoized by content hash"""
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        
+        with self.analysis_cache_lock:
+            results = self.analysis_cache.get(key)
+            if results is not None:
+                self.analysis_cache.move_to_end(key)
+        
+        if results is None:
+            results = self.run_content_analysis(text)
+            with self.analysis_cache_lock:
+                self.analysis_cache[key] = results
+                if len(self.analysis_cache) > self.analysis_cache_size:
+                    self.analysis_cache.popitem(last=False)
+        
+        # Callers get their own copy so they can't mutate the cached result
+        return copy.deepcopy(results)
+    
+    @cached_by_hash('resume', environment=analysis_environment)
+    def run_content_analysis(self, text):
+        """Run the full (uncached) content analysis"""
+        # Features several passes share, computed once
+        text_lower = text.lower()
+        numbers = NUMBER_PATTERN.findall(text)
+        word_count = len(text.split())
+        sections = self.identify_sections(text, text_lower)
+        
         # Clean and preprocess text
-        cleaned_text = self.clean_text(text)
+        cleaned_text = self.clean_text(text, text_lower)
         
-        # Extract various information
-        skills_found = self.extract_skills(cleaned_text)
-        contact_info = self.extract_contact_info(text)
-        experience_info = self.analyze_experience(text)
-        education_info = self.extract_education(text)
+        # Extract various information; cleaned text is already lowercase, so it serves as its own lowered form
+        skills_found = self.extract_skills(cleaned_text, cleaned_text)
+        contact_info = self.extract_contact_info(text, text_lower)
+        experience_info = self.analyze_experience(text, text_lower)
+        education_info = self.extract_education(text, text_lower)
         
         # Calculate scores
-        ats_score = self.calculate_ats_score(text, skills_found)
-        overall_score = self.calculate_overall_score(text, skills_found, experience_info)
+        ats_score = self.calculate_ats_score(text, skills_found, text_lower, numbers)
+        overall_score = self.calculate_overall_score(text, skills_found, experience_info, text_lower, word_count)
         
         # Generate recommendations
-        suggestions = self.generate_suggestions(text, skills_found, experience_info)
+        suggestions = self.generate_suggestions(text, skills_found, experience_info, numbers, sections, word_count)
         missing_keywords = self.find_missing_keywords(skills_found)
         
         return {
@@ -239,94 +500,79 @@ class ResumeAnalyzer:
             'years_experience': experience_info['years'],
             'contact_info': contact_info,
             'education': education_info,
-            'keyword_density': self.calculate_keyword_density(cleaned_text),
+            'keyword_density': self.calculate_keyword_density(cleaned_text, cleaned_text),
             'readability_score': self.calculate_readability(text),
-            'sections_found': self.identify_sections(text)
+            'sections_found': sections
         }
     
-    def clean_text(self, text):
+    def clean_text(self, text, text_lower=None):
         """Clean and normalize text"""
         # Convert to lowercase
-        text = text.lower()
+        text = text.lower() if text_lower is None else text_lower
         
         # Remove special characters but keep important ones
-        text = re.sub(r'[^\w\s\.\-\+\#\@]', ' ', text)
+        text = SPECIAL_CHARS_PATTERN.sub(' ', text)
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = WHITESPACE_PATTERN.sub(' ', text).strip()
         
         return text
     
-    def extract_skills(self, text):
+    def extract_skills(self, text, text_lower=None):
         """Extract technical skills from text"""
-        found_skills = []
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
-        # Check for each skill in our database
-        for skill in self.all_skills:
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.append(skill.title())
+        # Word-boundary matches for every skill and language spelling in our database
+        matched_phrases = self.skill_scanner.find(text_lower)
         
         # Remove duplicates and sort
-        found_skills = sorted(list(set(found_skills)))
+        found_titles = {self.skill_titles[phrase] for phrase in matched_phrases if phrase in self.skill_titles}
+        found_skills = sorted(found_titles)
         
         # Also look for programming languages with common variations
-        language_variations = {
-            'javascript': ['js', 'javascript', 'ecmascript'],
-            'typescript': ['ts', 'typescript'],
-            'python': ['python', 'python3', 'py'],
-            'c++': ['c++', 'cpp', 'cplusplus'],
-            'c#': ['c#', 'csharp', 'c sharp'],
-            'node.js': ['node', 'nodejs', 'node.js']
-        }
-        
-        for main_lang, variations in language_variations.items():
-            for variation in variations:
-                pattern = r'\b' + re.escape(variation.lower()) + r'\b'
-                if re.search(pattern, text_lower) and main_lang.title() not in found_skills:
-                    found_skills.append(main_lang.title())
+        for language, spellings in self.language_spellings:
+            if language not in found_titles and not spellings.isdisjoint(matched_phrases):
+                found_titles.add(language)
+                found_skills.append(language)
         
         return found_skills[:20]  # Limit to top 20 skills
     
-    def extract_contact_info(self, text):
+    def extract_contact_info(self, text, text_lower=None):
         """Extract contact information"""
         contact_info = {}
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Email pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
+        emails = EMAIL_PATTERN.findall(text)
         if emails:
             contact_info['email'] = emails[0]
         
         # Phone pattern
-        phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phones = re.findall(phone_pattern, text)
+        phones = PHONE_PATTERN.findall(text)
         if phones:
             contact_info['phone'] = ''.join(phones[0]) if isinstance(phones[0], tuple) else phones[0]
         
         # LinkedIn pattern
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        linkedin = re.findall(linkedin_pattern, text.lower())
+        linkedin = LINKEDIN_PATTERN.findall(text_lower)
         if linkedin:
             contact_info['linkedin'] = linkedin[0]
         
         # GitHub pattern
-        github_pattern = r'github\.com/[\w-]+'
-        github = re.findall(github_pattern, text.lower())
+        github = GITHUB_PATTERN.findall(text_lower)
         if github:
             contact_info['github'] = github[0]
         
         return contact_info
     
-    def analyze_experience(self, text):
+    def analyze_experience(self, text, text_lower=None):
         """Analyze work experience"""
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Look for year patterns
-        year_pattern = r'\b(19|20)\d{2}\b'
-        years = [int(year) for year in re.findall(year_pattern, text)]
+        years = [int(year) for year in YEAR_PATTERN.findall(text)]
         
         current_year = datetime.now().year
         experience_years = 0
@@ -361,21 +607,15 @@ class ResumeAnalyzer:
             'mentions': experience_mentions
         }
     
-    def extract_education(self, text):
+    def extract_education(self, text, text_lower=None):
         """Extract education information"""
         education = []
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Common degree patterns
-        degree_patterns = [
-            r'\b(bachelor|ba|bs|b\.a\.|b\.s\.)\b',
-            r'\b(master|ma|ms|m\.a\.|m\.s\.|mba)\b',
-            r'\b(phd|ph\.d\.|doctorate|doctoral)\b',
-            r'\b(associate|aa|as|a\.a\.|a\.s\.)\b'
-        ]
-        
-        for pattern in degree_patterns:
-            matches = re.findall(pattern, text_lower)
+        for pattern in DEGREE_PATTERNS:
+            matches = pattern.findall(text_lower)
             if matches:
                 education.extend(matches)
         
@@ -393,20 +633,22 @@ class ResumeAnalyzer:
             'fields': found_fields
         }
     
-    def calculate_ats_score(self, text, skills_found):
+    def calculate_ats_score(self, text, skills_found, text_lower=None, numbers=None):
         """Calculate ATS (Applicant Tracking System) compatibility score"""
         score = 0
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Check for contact information
         if '@' in text:  # Email
             score += 15
-        if re.search(r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}', text):  # Phone
+        if PHONE_DIGITS_PATTERN.search(text):  # Phone
             score += 10
         
         # Check for standard sections
         sections = ['experience', 'education', 'skills', 'summary', 'objective']
         for section in sections:
-            if section in text.lower():
+            if section in text_lower:
                 score += 8
         
         # Skills presence
@@ -422,7 +664,8 @@ class ResumeAnalyzer:
             score += 10
         
         # Quantifiable achievements (numbers)
-        numbers = re.findall(r'\d+', text)
+        if numbers is None:
+            numbers = NUMBER_PATTERN.findall(text)
         if len(numbers) >= 5:
             score += 15
         elif len(numbers) >= 3:
@@ -430,9 +673,13 @@ class ResumeAnalyzer:
         
         return min(100, score)
     
-    def calculate_overall_score(self, text, skills_found, experience_info):
+    def calculate_overall_score(self, text, skills_found, experience_info, text_lower=None, word_count=None):
         """Calculate overall resume score"""
         score = 0
+        if text_lower is None:
+            text_lower = text.lower()
+        if word_count is None:
+            word_count = len(text.split())
         
         # Skills score (30%)
         skills_score = min(30, len(skills_found) * 2)
@@ -443,7 +690,6 @@ class ResumeAnalyzer:
         score += exp_score
         
         # Content quality score (25%)
-        word_count = len(text.split())
         if word_count >= 300:
             content_score = 25
         elif word_count >= 200:
@@ -456,12 +702,12 @@ class ResumeAnalyzer:
         
         # Structure score (20%)
         structure_keywords = ['summary', 'experience', 'education', 'skills', 'projects']
-        structure_score = sum(4 for keyword in structure_keywords if keyword in text.lower())
+        structure_score = sum(4 for keyword in structure_keywords if keyword in text_lower)
         score += structure_score
         
         return min(100, score)
     
-    def calculate_keyword_density(self, text):
+    def calculate_keyword_density(self, text, text_lower=None):
         """Calculate keyword density for important terms"""
         words = text.split()
         total_words = len(words)
@@ -469,23 +715,20 @@ class ResumeAnalyzer:
         if total_words == 0:
             return {}
         
-        # Count important keywords
-        important_keywords = [
-            'experience', 'developed', 'managed', 'created', 'implemented',
-            'designed', 'built', 'led', 'improved', 'optimized'
-        ]
-        
-        density = {}
-        for keyword in important_keywords:
-            count = text.lower().count(keyword)
-            density[keyword] = round((count / total_words) * 100, 2)
+        # Count whole-word occurrences of important keywords, so 'led' no longer counts inside 'developed'
+        if text_lower is None:
+            text_lower = text.lower()
+        word_counts = Counter(WORD_PATTERN.findall(text_lower))
         
-        return density
+        return {
+            keyword: round((word_counts[keyword] / total_words) * 100, 2)
+            for keyword in self.important_keywords
+        }
     
     def calculate_readability(self, text):
         """Calculate basic readability score"""
-        sentences = sent_tokenize(text)
-        words = word_tokenize(text)
+        sentences = [sentence for sentence in SENTENCE_END_PATTERN.split(text) if sentence.strip()]
+        words = TOKEN_PATTERN.findall(text)
         
         if not sentences or not words:
             return 0
@@ -502,10 +745,11 @@ class ResumeAnalyzer:
         else:
             return 40
     
-    def identify_sections(self, text):
+    def identify_sections(self, text, text_lower=None):
         """Identify resume sections"""
         sections = []
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
         section_keywords = {
             'summary': ['summary', 'profile', 'objective', 'about'],
@@ -523,7 +767,7 @@ class ResumeAnalyzer:
         
         return sections
     
-    def generate_suggestions(self, text, skills_found, experience_info):
+    def generate_suggestions(self, text, skills_found, experience_info, numbers=None, sections=None, word_count=None):
         """Generate improvement suggestions"""
         suggestions = []
         
@@ -532,7 +776,8 @@ class ResumeAnalyzer:
             suggestions.append("Add more relevant technical skills to improve keyword matching")
         
         # Quantification suggestions
-        numbers = re.findall(r'\d+', text)
+        if numbers is None:
+            numbers = NUMBER_PATTERN.findall(text)
         if len(numbers) < 3:
             suggestions.append("Include quantifiable achievements (e.g., 'Improved performance by 30%')")
         
@@ -547,7 +792,8 @@ class ResumeAnalyzer:
             suggestions.append("Emphasize leadership experience and team management")
         
         # Section suggestions
-        sections = self.identify_sections(text)
+        if sections is None:
+            sections = self.identify_sections(text)
         if 'summary' not in sections:
             suggestions.append("Add a professional summary at the top of your resume")
         if 'projects' not in sections and experience_info['level'] in ['Junior', 'Mid-level']:
@@ -558,7 +804,8 @@ class ResumeAnalyzer:
         suggestions.append("Save your resume as both PDF and Word formats")
         
         # Content suggestions
-        word_count = len(text.split())
+        if word_count is None:
+            word_count = len(text.split())
         if word_count < 200:
             suggestions.append("Expand your resume content - aim for 300-500 words")
         elif word_count > 800:
@@ -568,20 +815,9 @@ class ResumeAnalyzer:
     
     def find_missing_keywords(self, skills_found):
         """Find important keywords that are missing"""
-        # Get trending skills for current year
-        trending_skills = [
-            'Machine Learning', 'Cloud Computing', 'DevOps', 'Microservices',
-            'API Development', 'Agile', 'Docker', 'Kubernetes', 'React',
-            'Python', 'JavaScript', 'Git', 'CI/CD', 'AWS'
-        ]
-        
         # Find missing trending skills
-        skills_lower = [skill.lower() for skill in skills_found]
-        missing = []
-        
-        for skill in trending_skills:
-            if skill.lower() not in skills_lower:
-                missing.append(skill)
+        skills_lower = {skill.lower() for skill in skills_found}
+        missing = [skill for skill in self.trending_skills if skill.lower() not in skills_lower]
         
         return missing[:6]  # Limit to top 6 missing keywords
     
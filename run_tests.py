@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+DevMatch AI - Test Runner
+Runs the application and enhanced analyzer test suites in one process
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Always run the analyzers for real instead of reading the persistent result cache
+os.environ['DEVMATCH_CACHE'] = '0'
+
+from test_app import run_all_tests
+from test_enhanced_analyzers import run_enhanced_tests
+
+if __name__ == "__main__":
+    # Change to the correct directory
+    script_dir = Path(__file__).parent
+    os.chdir(script_dir)
+    
+    # Run both suites even if the first one fails, so the report is complete
+    app_success = run_all_tests()
+    print()
+    enhanced_success = run_enhanced_tests()
+    sys.exit(0 if app_success and enhanced_success else 1)
@@ -8,7 +8,24 @@ import os
 import sys
 import subprocess
 import sqlite3
+import importlib.util
+import importlib.metadata
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# NLTK package -> resource directory; the trailing slash lets nltk.data.find also match zipped packages
+NLTK_PACKAGES = {
+    'punkt': 'tokenizers/punkt/',
+    'stopwords': 'corpora/stopwords/',
+    'wordnet': 'corpora/wordnet/',
+}
+SPACY_MODEL = 'en_core_web_sm'
+
+# Older pips are upgraded before installing requirements; newer ones are left alone
+MIN_PIP_VERSION = (24, 0)
+
+# Optional shared model directory (e.g. a Docker volume) so rebuilds reuse downloaded NLTK data
+NLP_CACHE_DIR = os.environ.get('DEVMATCH_NLP_CACHE_DIR')
 
 def print_banner():
     """Print setup banner"""
@@ -28,16 +45,33 @@ def check_python_version():
     print(f"✅ Python version: {sys.version.split()[0]}")
     return True
 
+def pip_needs_upgrade():
+    """Check whether the installed pip is older than MIN_PIP_VERSION, without importing pip"""
+    try:
+        version = importlib.metadata.version('pip')
+    except importlib.metadata.PackageNotFoundError:
+        return True
+    
+    parts = version.split('.')[:2]
+    try:
+        return tuple(int(part) for part in parts) < MIN_PIP_VERSION
+    except ValueError:
+        return True
+
 def install_dependencies():
     """Install Python dependencies"""
     print("\n📦 Installing Python dependencies...")
     
     try:
-        # Upgrade pip first
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", "pip"])
-        
-        # Install requirements
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        # Upgrade pip and install requirements in one pip process (one interpreter start, one resolve)
+        command = [
+            sys.executable, "-m", "pip", "install", "--upgrade",
+            "--disable-pip-version-check", "--no-input"
+        ]
+        if pip_needs_upgrade():
+            command.append("pip")
+        command += ["-r", "requirements.txt"]
+        subprocess.check_call(command)
         
         print("✅ Python dependencies installed successfully")
         return True
@@ -50,27 +84,52 @@ def download_nlp_models():
     """Download required NLP models"""
     print("\n🧠 Downloading NLP models...")
     
+    # Start the spaCy download in its own process so it overlaps the NLTK downloads
+    spacy_installed = importlib.util.find_spec(SPACY_MODEL) is not None
+    spacy_download = None
+    if not spacy_installed:
+        try:
+            spacy_download = subprocess.Popen([sys.executable, "-m", "spacy", "download", SPACY_MODEL])
+        except OSError:
+            spacy_download = None
+    
     try:
-        # Download NLTK data
         import nltk
-        nltk.download('punkt', quiet=True)
-        nltk.download('stopwords', quiet=True)
-        nltk.download('wordnet', quiet=True)
-        print("✅ NLTK models downloaded")
+        from nltk.downloader import Downloader
+        if NLP_CACHE_DIR and NLP_CACHE_DIR not in nltk.data.path:
+            nltk.data.path.insert(0, NLP_CACHE_DIR)
         
-        # Try to download spaCy model
-        try:
-            subprocess.check_call([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
-            print("✅ spaCy English model downloaded")
-        except subprocess.CalledProcessError:
-            print("⚠️  Warning: Could not download spaCy model. Basic NLP features will be used.")
+        # nltk.download contacts the index server even for installed packages, so only fetch what is missing
+        missing = []
+        for package, resource in NLTK_PACKAGES.items():
+            try:
+                nltk.data.find(resource)
+            except LookupError:
+                missing.append(package)
         
-        return True
+        # Download NLTK data, one Downloader per package since the shared nltk.download is not thread-safe
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                list(executor.map(
+                    lambda package: Downloader(download_dir=NLP_CACHE_DIR).download(package, quiet=True),
+                    missing
+                ))
+            print("✅ NLTK models downloaded")
+        else:
+            print("✅ NLTK models already installed")
         
     except Exception as e:
         print(f"⚠️  Warning: Error downloading NLP models: {e}")
         print("The application will work with basic NLP features.")
-        return True
+    
+    if spacy_installed:
+        print("✅ spaCy English model already installed")
+    elif spacy_download is not None and spacy_download.wait() == 0:
+        print("✅ spaCy English model downloaded")
+    else:
+        print("⚠️  Warning: Could not download spaCy model. Basic NLP features will be used.")
+    
+    return True
 
 def create_directories():
     """Create necessary directories"""
@@ -99,10 +158,15 @@ def initialize_database():
     
     try:
         conn = sqlite3.connect('devmatch.db')
-        cursor = conn.cursor()
         
-        # Create tables
-        cursor.execute('''
+        # WAL persists in the database file, so the app's connections also get cheaper commits
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        
+        # Create tables and indexes in one transaction so the schema costs a single sync
+        conn.executescript('''
+            BEGIN;
+            
             CREATE TABLE IF NOT EXISTS analyses (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 session_id TEXT NOT NULL,
@@ -110,28 +174,28 @@ def initialize_database():
                 filename TEXT NOT NULL,
                 results TEXT NOT NULL,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        cursor.execute('''
+            );
+            
             CREATE TABLE IF NOT EXISTS user_sessions (
                 session_id TEXT PRIMARY KEY,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 last_activity TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        cursor.execute('''
+            );
+            
             CREATE TABLE IF NOT EXISTS job_recommendations (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 session_id TEXT NOT NULL,
                 job_data TEXT NOT NULL,
                 match_score INTEGER NOT NULL,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
+            );
+            
+            CREATE INDEX IF NOT EXISTS idx_analyses_session ON analyses(session_id);
+            CREATE INDEX IF NOT EXISTS idx_job_recommendations_session ON job_recommendations(session_id);
+            
+            COMMIT;
         ''')
         
-        conn.commit()
         conn.close()
         
         print("✅ Database initialized")
@@ -154,8 +218,12 @@ def create_init_files():
     
     for module in modules:
         init_file = Path(module) / '__init__.py'
-        if not init_file.exists():
-            init_file.write_text('"""DevMatch AI Module"""')
+        # Exclusive create skips existing files without a separate exists() probe
+        try:
+            with init_file.open('x') as file:
+                file.write('"""DevMatch AI Module"""')
+        except FileExistsError:
+            pass
     
     print("✅ Python modules initialized")
 
@@ -163,6 +231,11 @@ def test_installation():
     """Test if installation was successful"""
     print("\n🧪 Testing installation...")
     
+    # Repeated CI provisioning can opt out of constructing every analyzer
+    if os.environ.get('DEVMATCH_SKIP_SMOKE') == '1':
+        print("⏭️  Skipping installation test (DEVMATCH_SKIP_SMOKE=1)")
+        return True
+    
     try:
         # Test imports
         from resume_scanner.resume_analyzer import ResumeAnalyzer
@@ -10,6 +10,9 @@ import json
 import tempfile
 from pathlib import Path
 
+# Always run the analyzers for real instead of reading the persistent result cache
+os.environ['DEVMATCH_CACHE'] = '0'
+
 def test_imports():
     """Test that all modules can be imported"""
     print("🧪 Testing module imports...")
@@ -197,19 +200,21 @@ def test_database():
         # Check if database exists and has tables
         if os.path.exists('devmatch.db'):
             conn = sqlite3.connect('devmatch.db')
-            cursor = conn.cursor()
-            
-            # Check tables
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = cursor.fetchall()
-            
-            conn.close()
+            try:
+                # Count only the tables setup.py creates
+                cursor = conn.execute(
+                    "SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name IN (?, ?, ?)",
+                    ('analyses', 'user_sessions', 'job_recommendations')
+                )
+                table_count = cursor.fetchone()[0]
+            finally:
+                conn.close()
             
-            if len(tables) >= 3:  # Should have at least 3 tables
-                print(f"✅ Database operational - {len(tables)} tables found")
+            if table_count == 3:
+                print(f"✅ Database operational - {table_count} tables found")
                 return True
             else:
-                print(f"⚠️  Database exists but missing tables - only {len(tables)} found")
+                print(f"⚠️  Database exists but missing tables - only {table_count} found")
                 return False
         else:
             print("❌ Database file not found")
@@ -5,16 +5,24 @@ Test the new C++, Java, and Go analyzers
 """
 
 import os
-import tempfile
 from pathlib import Path
+from functools import lru_cache
+
+# Always run the analyzers for real instead of reading the persistent result cache
+os.environ['DEVMATCH_CACHE'] = '0'
+
+@lru_cache(maxsize=1)
+def get_checker():
+    """Build the CodeQualityChecker once and share it across the tests"""
+    from code_analyzers import CodeQualityChecker
+    return CodeQualityChecker()
 
 def test_cpp_analyzer():
     """Test the C++ analyzer"""
     print("🧪 Testing Enhanced C++ Analyzer...")
     
     try:
-        from code_analyzers import CodeQualityChecker
-        checker = CodeQualityChecker()
+        checker = get_checker()
         
         # Sample C++ code
         cpp_code = '''
@@ -52,26 +60,18 @@ def test_cpp_analyzer():
         }
         '''
         
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.cpp', delete=False) as f:
-            f.write(cpp_code)
-            temp_file = f.name
+        results = checker.analyze_source(cpp_code, '.cpp')
         
-        try:
-            results = checker.analyze_file(temp_file)
-            
-            if results and 'quality_score' in results:
-                print(f"✅ C++ analysis successful - Quality score: {results['quality_score']}")
-                if 'memory_analysis' in results:
-                    print(f"   Memory safety score: {results['memory_analysis']['memory_safety_score']}")
-                if 'performance_analysis' in results:
-                    print(f"   Performance score: {results['performance_analysis']['performance_score']}")
-                return True
-            else:
-                print("❌ C++ analysis failed - no advanced results")
-                return False
-        finally:
-            os.unlink(temp_file)
+        if results and 'quality_score' in results:
+            print(f"✅ C++ analysis successful - Quality score: {results['quality_score']}")
+            if 'memory_analysis' in results:
+                print(f"   Memory safety score: {results['memory_analysis']['memory_safety_score']}")
+            if 'performance_analysis' in results:
+                print(f"   Performance score: {results['performance_analysis']['performance_score']}")
+            return True
+        else:
+            print("❌ C++ analysis failed - no advanced results")
+            return False
             
     except Exception as e:
         print(f"❌ C++ analyzer test failed: {e}")
@@ -82,8 +82,7 @@ def test_java_analyzer():
     print("\n☕ Testing Enhanced Java Analyzer...")
     
     try:
-        from code_analyzers import CodeQualityChecker
-        checker = CodeQualityChecker()
+        checker = get_checker()
         
         # Sample Java code
         java_code = '''
@@ -128,26 +127,18 @@ def test_java_analyzer():
         }
         '''
         
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.java', delete=False) as f:
-            f.write(java_code)
-            temp_file = f.name
+        results = checker.analyze_source(java_code, '.java')
         
-        try:
-            results = checker.analyze_file(temp_file)
-            
-            if results and 'quality_score' in results:
-                print(f"✅ Java analysis successful - Quality score: {results['quality_score']}")
-                if 'oop_analysis' in results:
-                    print(f"   OOP score: {results['oop_analysis']['overall_oop_score']:.1f}")
-                if 'class_analysis' in results:
-                    print(f"   Classes found: {len(results['class_analysis']['classes_found'])}")
-                return True
-            else:
-                print("❌ Java analysis failed - no advanced results")
-                return False
-        finally:
-            os.unlink(temp_file)
+        if results and 'quality_score' in results:
+            print(f"✅ Java analysis successful - Quality score: {results['quality_score']}")
+            if 'oop_analysis' in results:
+                print(f"   OOP score: {results['oop_analysis']['overall_oop_score']:.1f}")
+            if 'class_analysis' in results:
+                print(f"   Classes found: {len(results['class_analysis']['classes_found'])}")
+            return True
+        else:
+            print("❌ Java analysis failed - no advanced results")
+            return False
             
     except Exception as e:
         print(f"❌ Java analyzer test failed: {e}")
@@ -158,8 +149,7 @@ def test_go_analyzer():
     print("\n🐹 Testing Enhanced Go Analyzer...")
     
     try:
-        from code_analyzers import CodeQualityChecker
-        checker = CodeQualityChecker()
+        checker = get_checker()
         
         # Sample Go code
         go_code = '''
@@ -246,28 +236,20 @@ def test_go_analyzer():
         }
         '''
         
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.go', delete=False) as f:
-            f.write(go_code)
-            temp_file = f.name
+        results = checker.analyze_source(go_code, '.go')
         
-        try:
-            results = checker.analyze_file(temp_file)
-            
-            if results and 'quality_score' in results:
-                print(f"✅ Go analysis successful - Quality score: {results['quality_score']}")
-                if 'concurrency_analysis' in results:
-                    print(f"   Concurrency score: {results['concurrency_analysis']['concurrency_score']}")
-                    print(f"   Goroutines: {results['concurrency_analysis']['goroutines_used']}")
-                    print(f"   Channels: {results['concurrency_analysis']['channels_used']}")
-                if 'package_analysis' in results:
-                    print(f"   Package: {results['package_analysis']['package_name']}")
-                return True
-            else:
-                print("❌ Go analysis failed - no advanced results")
-                return False
-        finally:
-            os.unlink(temp_file)
+        if results and 'quality_score' in results:
+            print(f"✅ Go analysis successful - Quality score: {results['quality_score']}")
+            if 'concurrency_analysis' in results:
+                print(f"   Concurrency score: {results['concurrency_analysis']['concurrency_score']}")
+                print(f"   Goroutines: {results['concurrency_analysis']['goroutines_used']}")
+                print(f"   Channels: {results['concurrency_analysis']['channels_used']}")
+            if 'package_analysis' in results:
+                print(f"   Package: {results['package_analysis']['package_name']}")
+            return True
+        else:
+            print("❌ Go analysis failed - no advanced results")
+            return False
             
     except Exception as e:
         print(f"❌ Go analyzer test failed: {e}")
@@ -278,8 +260,7 @@ def test_basic_analyzers():
     print("\n🔧 Testing Basic Analyzers...")
     
     try:
-        from code_analyzers import CodeQualityChecker
-        checker = CodeQualityChecker()
+        checker = get_checker()
         
         # Test Python
         python_code = '''
@@ -298,19 +279,12 @@ class Calculator:
         return result
         '''
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(python_code)
-            temp_file = f.name
-        
-        try:
-            results = checker.analyze_file(temp_file)
-            if results and 'quality_score' in results:
-                print(f"✅ Python analysis: {results['quality_score']}")
-            else:
-                print("❌ Python analysis failed")
-                return False
-        finally:
-            os.unlink(temp_file)
+        results = checker.analyze_source(python_code, '.py')
+        if results and 'quality_score' in results:
+            print(f"✅ Python analysis: {results['quality_score']}")
+        else:
+            print("❌ Python analysis failed")
+            return False
         
         # Test JavaScript
         js_code = '''
@@ -334,19 +308,12 @@ class Calculator:
         console.log(calc.add(5, 3));
         '''
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as f:
-            f.write(js_code)
-            temp_file = f.name
-        
-        try:
-            results = checker.analyze_file(temp_file)
-            if results and 'quality_score' in results:
-                print(f"✅ JavaScript analysis: {results['quality_score']}")
-            else:
-                print("❌ JavaScript analysis failed")
-                return False
-        finally:
-            os.unlink(temp_file)
+        results = checker.analyze_source(js_code, '.js')
+        if results and 'quality_score' in results:
+            print(f"✅ JavaScript analysis: {results['quality_score']}")
+        else:
+            print("❌ JavaScript analysis failed")
+            return False
         
         return True
         
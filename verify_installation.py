@@ -7,8 +7,12 @@ Checks that all components are properly installed and working
 import os
 import sys
 import importlib
-import sqlite3
+import importlib.util
 from pathlib import Path
+from contextlib import closing
+
+# Checks resolve paths against the project directory, so the script works from any working directory
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 
 def print_header():
     """Print verification header"""
@@ -44,22 +48,19 @@ def check_required_packages():
         'Pillow'
     ]
     
+    # Packages whose import name differs from the name they are installed under
+    import_names = {
+        'python-docx': 'docx',
+        'Pillow': 'PIL'
+    }
+    
     missing_packages = []
     
     for package in required_packages:
-        try:
-            if package == 'sklearn':
-                importlib.import_module('sklearn')
-            elif package == 'python-docx':
-                importlib.import_module('docx')
-            elif package == 'PyPDF2':
-                importlib.import_module('PyPDF2')
-            elif package == 'Pillow':
-                importlib.import_module('PIL')
-            else:
-                importlib.import_module(package)
+        # find_spec locates the package without executing it; importing sklearn alone takes over a second
+        if importlib.util.find_spec(import_names.get(package, package)) is not None:
             print(f"   ✅ {package} - Installed")
-        except ImportError:
+        else:
             print(f"   ❌ {package} - Missing")
             missing_packages.append(package)
     
@@ -71,6 +72,14 @@ def check_required_packages():
         print("   🎉 All packages installed!")
         return True
 
+def list_directory(path):
+    """Map the entry names in path to their DirEntry objects, or return {} if path cannot be listed"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
 def check_project_structure():
     """Check if all required files and folders exist"""
     print("\n📁 Checking project structure...")
@@ -96,9 +105,12 @@ def check_project_structure():
     missing_files = []
     missing_folders = []
     
+    # One directory listing answers every top-level lookup; DirEntry caches the entry type
+    top_level = list_directory(PROJECT_ROOT)
+    
     # Check files
     for file in required_files:
-        if os.path.exists(file):
+        if file in top_level and top_level[file].is_file():
             print(f"   ✅ {file} - Found")
         else:
             print(f"   ❌ {file} - Missing")
@@ -106,7 +118,7 @@ def check_project_structure():
     
     # Check folders
     for folder in required_folders:
-        if os.path.exists(folder):
+        if folder in top_level and top_level[folder].is_dir():
             print(f"   ✅ {folder}/ - Found")
         else:
             print(f"   ❌ {folder}/ - Missing")
@@ -159,13 +171,14 @@ def check_database():
     print("\n🗄️ Checking database...")
     
     try:
-        # Try to connect to database
-        conn = sqlite3.connect('devmatch.db')
-        cursor = conn.cursor()
+        # Imported here so runs that never reach this check skip loading the SQLite extension
+        import sqlite3
         
-        # Check if tables exist
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = cursor.fetchall()
+        # Connect read-only so verification never creates or modifies the database file
+        database_uri = Path(PROJECT_ROOT, 'devmatch.db').as_uri() + '?mode=ro'
+        with closing(sqlite3.connect(database_uri, uri=True)) as conn:
+            # Check if tables exist
+            tables = conn.execute("SELECT name FROM sqlite_master WHERE type='table';").fetchall()
         
         if tables:
             print(f"   ✅ Database connected - {len(tables)} tables found")
@@ -175,7 +188,6 @@ def check_database():
             print("   ⚠️  Database connected but no tables found")
             print("      Run: python setup.py")
         
-        conn.close()
         return True
         
     except Exception as e:
@@ -193,17 +205,19 @@ def check_nltk_data():
         required_data = ['punkt', 'stopwords', 'wordnet', 'punkt_tab']
         missing_data = []
         
+        # List each data directory's tokenizers/ and corpora/ once instead of a multi-stat find() per resource;
+        # stripping the extension also counts packages that are only present as .zip archives
+        available_data = set()
+        for root in nltk.data.path:
+            for category in ('tokenizers', 'corpora'):
+                available_data.update(name.split('.')[0] for name in list_directory(os.path.join(root, category)))
+        
         for data in required_data:
-            try:
-                nltk.data.find(f'tokenizers/{data}')
+            if data in available_data:
                 print(f"   ✅ {data} - Available")
-            except LookupError:
-                try:
-                    nltk.data.find(f'corpora/{data}')
-                    print(f"   ✅ {data} - Available")
-                except LookupError:
-                    print(f"   ❌ {data} - Missing")
-                    missing_data.append(data)
+            else:
+                print(f"   ❌ {data} - Missing")
+                missing_data.append(data)
         
         if missing_data:
             print(f"\n⚠️  Missing NLTK data: {', '.join(missing_data)}")
@@ -261,8 +275,14 @@ def check_web_interface():
     
     missing_web_files = []
     
+    # List each parent directory once instead of stat-ing every path
+    listings = {}
+    
     for file in web_files:
-        if os.path.exists(file):
+        parent, name = os.path.split(file)
+        if parent not in listings:
+            listings[parent] = list_directory(os.path.join(PROJECT_ROOT, parent))
+        if name in listings[parent] and listings[parent][name].is_file():
             print(f"   ✅ {file} - Found")
         else:
             print(f"   ❌ {file} - Missing")
@@ -290,9 +310,20 @@ def run_verification():
         ("Web Interface", check_web_interface)
     ]
     
+    # Checks that cannot pass when an earlier check failed, mapped to that check
+    prerequisites = {
+        "Basic Functionality": "Custom Modules"
+    }
+    
     results = []
     
     for check_name, check_func in checks:
+        prerequisite = prerequisites.get(check_name)
+        if prerequisite and not dict(results).get(prerequisite):
+            print(f"\n⏭️  Skipping {check_name} - {prerequisite} check failed")
+            results.append((check_name, False))
+            continue
+        
         try:
             result = check_func()
             results.append((check_name, result))
@@ -341,9 +372,5 @@ def run_verification():
     return passed == total
 
 if __name__ == "__main__":
-    # Change to script directory
-    script_dir = Path(__file__).parent
-    os.chdir(script_dir)
-    
     success = run_verification()
     exit(0 if success else 1)
\ No newline at end of file